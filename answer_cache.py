@@ -0,0 +1,154 @@
+"""Content-addressed on-disk cache of star answers"""
+
+__author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
+__date__ = "2025"
+__license__ = "MIT"
+
+import argparse
+import contextlib
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+
+DIRECTORY = ".answer_cache"
+MAX_ENTRIES = 1000
+MAX_BYTES = 1 << 20
+
+
+def main():
+    """List, evict or invalidate cached answers."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("command", choices=("list", "evict", "clear"))
+    parser.add_argument("days", nargs="*", type=int)
+    parser.add_argument("--max-entries", type=int, default=MAX_ENTRIES)
+    parser.add_argument("--max-bytes", type=int, default=MAX_BYTES)
+    args = parser.parse_args()
+
+    if args.command == "evict":
+        evict(args.max_entries, args.max_bytes)
+
+        return
+
+    for path, entry in load_entries(args.days):
+        if args.command == "clear":
+            os.remove(path)
+        else:
+            answer = entry["answer"].strip().partition("\n")[0]
+            print(f"{entry['day']:>3} {entry['star']:>4} {answer}")
+
+
+def compute_key(module, star, input_path):
+    """Compute the cache key of a star from its input and source code."""
+    digest = hashlib.sha256(f"{module.__name__}.star_{star}".encode())
+
+    with open(input_path, "rb") as input_file:
+        digest.update(hashlib.file_digest(input_file, "sha256").digest())
+
+    for path in sorted(get_sources(module)):
+        with open(path, "rb") as source_file:
+            digest.update(hashlib.file_digest(source_file, "sha256").digest())
+
+    return digest.hexdigest()
+
+
+def evict(max_entries=MAX_ENTRIES, max_bytes=MAX_BYTES):
+    """Remove least recently used entries beyond the cache limits."""
+    if not os.path.isdir(DIRECTORY):
+        return
+
+    entries = []
+
+    for entry in os.scandir(DIRECTORY):
+        if entry.name.endswith(".json"):
+            with contextlib.suppress(FileNotFoundError):
+                entries.append((entry.stat(), entry.path))
+
+    entries.sort(key=lambda entry: entry[0].st_mtime, reverse=True)
+    total = 0
+
+    for i, (stat, path) in enumerate(entries):
+        total += stat.st_size
+
+        if i >= max_entries or total > max_bytes:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+
+
+def get(key):
+    """Get a cached answer, marking it as recently used."""
+    path = os.path.join(DIRECTORY, f"{key}.json")
+
+    try:
+        with open(path, encoding="ascii") as entry_file:
+            entry = json.load(entry_file)
+    except (OSError, ValueError):
+        return None
+
+    with contextlib.suppress(FileNotFoundError):
+        os.utime(path)
+
+    return entry["answer"]
+
+
+def get_sources(module):
+    """Get the source files of a module and of the local modules it uses."""
+    root = os.path.dirname(os.path.abspath(module.__file__))
+    sources = set()
+    pending = [module]
+
+    while pending:
+        module = pending.pop()
+        path = getattr(module, "__file__", None)
+
+        if (
+            path is None
+            or os.path.dirname(os.path.abspath(path)) != root
+            or os.path.abspath(path) in sources
+        ):
+            continue
+
+        sources.add(os.path.abspath(path))
+        pending.extend(map(inspect.getmodule, vars(module).values()))
+
+    return sources
+
+
+def load_entries(days=None):
+    """Load cached entries, optionally restricted to some days."""
+    if not os.path.isdir(DIRECTORY):
+        return []
+
+    entries = []
+
+    for entry in os.scandir(DIRECTORY):
+        if not entry.name.endswith(".json"):
+            continue
+
+        with open(entry.path, encoding="ascii") as entry_file:
+            data = json.load(entry_file)
+
+        if not days or data["day"] in days:
+            entries.append((entry.path, data))
+
+    return sorted(
+        entries, key=lambda entry: (entry[1]["day"], entry[1]["star"])
+    )
+
+
+def put(key, day, star, answer):
+    """Store an answer and evict old entries."""
+    os.makedirs(DIRECTORY, exist_ok=True)
+
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="ascii", dir=DIRECTORY, suffix=".tmp", delete=False
+    ) as entry_file:
+        json.dump({"day": day, "star": star, "answer": answer}, entry_file)
+
+    os.replace(entry_file.name, os.path.join(DIRECTORY, f"{key}.json"))
+    evict()
+
+
+if __name__ == "__main__":
+    main()
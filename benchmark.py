@@ -0,0 +1,794 @@
+"""Benchmark of all days on scaled synthetic inputs"""
+
+__author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
+__date__ = "2025"
+__license__ = "MIT"
+
+import argparse
+import functools
+import importlib
+import itertools
+import json
+import math
+import os
+import random
+import string
+
+import cycles
+import day_9
+import day_11
+import day_12
+import day_13
+import device
+import inputs
+import runner
+
+ENGINES = {
+    9: {
+        "deque": day_9.compute_max_score,
+        "array": day_9.compute_max_score_linked,
+        "batched": day_9.compute_max_score_batched,
+    },
+    11: {
+        "sequential": day_11.solve_serial_numbers,
+        "parallel": functools.partial(day_11.solve_serial_numbers, jobs=0),
+    },
+    13: {
+        "tick": day_13.find_last_cart,
+        "graph": day_13.find_last_cart_graph,
+    },
+}
+SCALED_ENGINES = frozenset((13,))
+SCALES = (1, 10, 100)
+SERIAL_ENGINES = frozenset((11,))
+SIZES = {9: (10**7, 10**8), 11: (10, 100), 13: SCALES}
+
+
+def main():
+    """Generate scaled inputs and benchmark the selected days."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("days", nargs="*", type=int, default=runner.DAYS)
+    parser.add_argument("--scales", nargs="+", type=int, default=SCALES)
+    parser.add_argument(
+        "--max-time",
+        type=float,
+        default=60,
+        help="give up on a star after this long and skip its larger scales",
+    )
+    parser.add_argument("--output", default="data/benchmark")
+    parser.add_argument("--json", help="write results as JSON to this path")
+    parser.add_argument(
+        "--engines",
+        action="store_true",
+        help="compare the alternative engines of the days instead",
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        help="problem sizes of the engines, serial counts of day 11 or "
+        "input scales of day 13",
+    )
+    args = parser.parse_args()
+
+    if args.engines:
+        results = [
+            result
+            for day in args.days
+            if day in ENGINES
+            for result in compare_engines(
+                day, args.sizes or SIZES[day], args.output
+            )
+        ]
+        print(format_engine_table(results))
+
+        return
+
+    os.makedirs(args.output, exist_ok=True)
+    results = [
+        result
+        for day in args.days
+        for result in benchmark_day(
+            day, sorted(args.scales), args.max_time, args.output
+        )
+    ]
+
+    print(format_table(results))
+
+    if args.json:
+        with open(args.json, "w", encoding="ascii") as output_file:
+            json.dump(results, output_file)
+
+
+def benchmark_day(day, scales, max_time, output):
+    """Benchmark all stars of a day over the given scales."""
+    module = importlib.import_module(f"day_{day}")
+    stars = [star for star in runner.STARS if hasattr(module, f"star_{star}")]
+    times = {star: {} for star in stars}
+    failures = {star: {} for star in stars}
+
+    for scale in scales:
+        path = write_input(day, scale, output)
+        puzzle_input = inputs.load(day, path)
+
+        for star in stars:
+            if failures[star]:
+                continue
+
+            clear_caches(module)
+            wall_time, failure = time_star(
+                getattr(module, f"star_{star}"), puzzle_input, max_time
+            )
+
+            if failure is None:
+                times[star][scale] = wall_time
+            else:
+                failures[star][scale] = failure
+
+    clear_caches(module)
+
+    return [
+        {
+            "day": day,
+            "star": star,
+            "times": times[star],
+            "failures": failures[star],
+            "exponent": fit_exponent(times[star]),
+        }
+        for star in stars
+    ]
+
+
+def clear_caches(module):
+    """Drop the memoised parses of a day and the inputs they came from."""
+    for value in vars(module).values():
+        if callable(getattr(value, "cache_clear", None)):
+            value.cache_clear()
+
+    inputs.load_file.cache_clear()
+
+
+def compare_engines(day, sizes, output):
+    """Time every engine of a day on every problem size."""
+    engines = get_engines(day)
+    results = []
+
+    for size in sizes:
+        argument = size
+
+        if day in SCALED_ENGINES:
+            os.makedirs(output, exist_ok=True)
+            argument = inputs.load(day, write_input(day, size, output))
+        elif day in SERIAL_ENGINES:
+            argument = range(1, size + 1)
+
+        for name, engine in engines.items():
+            result = runner.run_star(
+                day, None, engine, argument, trace_memory=False
+            )
+            results.append(
+                {
+                    "day": day,
+                    "engine": name,
+                    "size": size,
+                    "answer": result.answer,
+                    "time": result.wall_time,
+                }
+            )
+
+    return results
+
+
+def draw_loop(grid, top, bottom, left, right):
+    """Draw a track loop, returning its straight cells and cart symbols."""
+    straights = []
+
+    for j in range(left + 1, right):
+        for row in (top, bottom):
+            grid[row][j] = "+" if grid[row][j] == "|" else "-"
+            straights.append((row, j, "<>"))
+
+    for j in range(top + 1, bottom):
+        for column in (left, right):
+            grid[j][column] = "+" if grid[j][column] == "-" else "|"
+            straights.append((j, column, "^v"))
+
+    grid[top][left] = grid[bottom][right] = "/"
+    grid[top][right] = grid[bottom][left] = "\\"
+
+    return straights
+
+
+def find_networks(loops):
+    """Label track loops by the network of crossing loops they belong to."""
+    parents = list(range(len(loops)))
+
+    def find(i):
+        while parents[i] != i:
+            parents[i] = parents[parents[i]]
+            i = parents[i]
+
+        return i
+
+    for i, j in itertools.permutations(range(len(loops)), 2):
+        top, bottom, left, right = loops[i]
+
+        if any(left < loops[j][k] < right for k in (2, 3)) and any(
+            loops[j][0] < row < loops[j][1] for row in (top, bottom)
+        ):
+            parents[find(i)] = find(j)
+
+    return [find(i) for i in range(len(loops))]
+
+
+def fit_exponent(times):
+    """Fit the exponent of a power law to times by input scale."""
+    points = [
+        (math.log(scale), math.log(time))
+        for scale, time in times.items()
+        if time > 0
+    ]
+
+    if len(points) < 2:
+        return None
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+
+    if variance == 0:
+        return None
+
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+
+def format_engine_table(results):
+    """Format engine comparison results as a table."""
+    lines = [f"{'day':>3} {'engine':<10} {'size':>12} {'time (s)':>10} answer"]
+
+    for result in results:
+        lines.append(
+            f"{result['day']:>3} {result['engine']:<10} {result['size']:>12} "
+            f"{result['time']:>10.3f} {runner.format_answer(result['answer'])}"
+        )
+
+    return "\n".join(lines)
+
+
+def format_failure(failure):
+    """Format the reason a star gave up at a scale as a table cell."""
+    if failure is None:
+        return "-"
+
+    return failure if failure == "timeout" else "error"
+
+
+def format_table(results):
+    """Format benchmark results as a table."""
+    scales = sorted(
+        {
+            scale
+            for result in results
+            for runs in (result["times"], result["failures"])
+            for scale in runs
+        }
+    )
+    lines = [
+        f"{'day':>3} {'star':>4} "
+        + " ".join(f"{f'{scale}x (s)':>10}" for scale in scales)
+        + f" {'exponent':>8}"
+    ]
+
+    for result in results:
+        times = " ".join(
+            (
+                f"{result['times'][scale]:>10.3f}"
+                if scale in result["times"]
+                else f"{format_failure(result['failures'].get(scale)):>10}"
+            )
+            for scale in scales
+        )
+        exponent = (
+            f"{result['exponent']:>8.2f}"
+            if result["exponent"] is not None
+            else f"{'-':>8}"
+        )
+        lines.append(
+            f"{result['day']:>3} {result['star']:>4} {times} {exponent}"
+        )
+
+    return "\n".join(lines)
+
+
+def generate_day_1(puzzle_input, scale, rng):
+    """Generate frequency changes whose total drift is one."""
+    changes = [
+        rng.choice((-1, 1)) * rng.randint(1, 20)
+        for _ in range(len(puzzle_input) * scale - 1)
+    ]
+    changes.append(1 - sum(changes))
+
+    return [f"{change:+d}" for change in changes]
+
+
+def generate_day_2(puzzle_input, scale, rng):
+    """Generate box IDs with a single pair differing by one letter."""
+    length = len(puzzle_input[0])
+    ids = [
+        "".join(rng.choice(string.ascii_lowercase) for _ in range(length))
+        for _ in range(len(puzzle_input) * scale - 1)
+    ]
+    i = rng.randrange(length)
+    twin = list(ids[-1])
+    twin[i] = chr((ord(twin[i]) - ord("a") + 1) % 26 + ord("a"))
+    ids.insert(rng.randrange(len(ids)), "".join(twin))
+
+    return ids
+
+
+def generate_day_3(puzzle_input, scale, rng):
+    """Generate claims on a fabric growing with the number of claims."""
+    side = int(1000 * math.sqrt(scale))
+
+    return [
+        f"#{i} @ {rng.randrange(side - 30)},{rng.randrange(side - 30)}: "
+        f"{rng.randint(10, 29)}x{rng.randint(10, 29)}"
+        for i in range(1, len(puzzle_input) * scale + 1)
+    ]
+
+
+def generate_day_4(puzzle_input, scale, rng):
+    """Generate shuffled guard records, one shift per night."""
+    guards = [rng.randrange(10, 4000) for _ in range(20)]
+    lines = []
+    night = 0
+
+    while len(lines) < len(puzzle_input) * scale:
+        date = (
+            f"{1518 + night // 336:04}-{night // 28 % 12 + 1:02}-"
+            f"{night % 28 + 1:02}"
+        )
+        night += 1
+        lines.append(
+            f"[{date} 00:00] Guard #{rng.choice(guards)} begins shift"
+        )
+        minutes = sorted(rng.sample(range(1, 60), 2 * rng.randint(0, 3)))
+
+        for start, end in zip(minutes[::2], minutes[1::2]):
+            lines.append(f"[{date} 00:{start:02}] falls asleep")
+            lines.append(f"[{date} 00:{end:02}] wakes up")
+
+    rng.shuffle(lines)
+
+    return lines
+
+
+def generate_day_5(puzzle_input, scale, rng):
+    """Generate a polymer of random units."""
+    return [
+        "".join(
+            rng.choice(string.ascii_letters)
+            for _ in range(len(puzzle_input[0]) * scale)
+        )
+    ]
+
+
+def generate_day_6(puzzle_input, scale, rng):
+    """Generate coordinates on a map growing with their number."""
+    side = int(400 * math.sqrt(scale))
+
+    return [
+        f"{rng.randrange(side)}, {rng.randrange(side)}"
+        for _ in range(len(puzzle_input) * scale)
+    ]
+
+
+def generate_day_7(puzzle_input, scale, rng):
+    """Generate requirements between the 26 steps, capped when complete."""
+    steps = list(string.ascii_uppercase)
+    rng.shuffle(steps)
+    pairs = list(itertools.combinations(steps, 2))
+
+    return [
+        f"Step {before} must be finished before step {after} can begin."
+        for before, after in rng.sample(
+            pairs, min(len(puzzle_input) * scale, len(pairs))
+        )
+    ]
+
+
+def generate_day_8(puzzle_input, scale, rng):
+    """Generate a random tree of nodes with metadata."""
+    n_nodes = len(puzzle_input[0].split()) // 8 * scale
+    children = [[] for _ in range(n_nodes)]
+
+    for i in range(1, n_nodes):
+        children[rng.randrange(i)].append(i)
+
+    numbers = []
+    stack = [(0, None)]
+
+    while stack:
+        node, n_metadata = stack.pop()
+
+        if n_metadata is None:
+            n_metadata = rng.randint(1, 11)
+            numbers.extend((len(children[node]), n_metadata))
+            stack.append((node, n_metadata))
+            stack.extend((child, None) for child in reversed(children[node]))
+        else:
+            numbers.extend(rng.randint(1, 9) for _ in range(n_metadata))
+
+    return [" ".join(map(str, numbers))]
+
+
+def generate_day_9(puzzle_input, scale, rng):
+    """Generate a game with proportionally more marbles."""
+    chunks = puzzle_input[0].split()
+    players = rng.randint(int(chunks[0]) // 2, int(chunks[0]) * 2)
+
+    return [
+        f"{players} players; last marble is worth "
+        f"{int(chunks[-2]) * scale} points"
+    ]
+
+
+def generate_day_10(puzzle_input, scale, rng):
+    """Generate points converging into a wider message."""
+    points = []
+
+    for _ in range(len(puzzle_input) * scale):
+        x = rng.randrange(60 * scale)
+        y = rng.randrange(10)
+        vx = rng.randint(-5, 5)
+        vy = rng.choice((-5, -4, -3, -2, -1, 1, 2, 3, 4, 5))
+        points.append(
+            f"position=<{x - 10000 * vx:>6}, {y - 10000 * vy:>6}> "
+            f"velocity=<{vx:>2}, {vy:>2}>"
+        )
+
+    return points
+
+
+def generate_day_11(puzzle_input, scale, rng):
+    """Generate a serial number, the grid size being fixed."""
+    del puzzle_input, scale
+
+    return [str(rng.randrange(1, 10000))]
+
+
+def generate_day_12(puzzle_input, scale, rng):
+    """Generate blocks settling like the input, too far apart to meet."""
+    state = puzzle_input[0].split()[-1]
+    pots, rules = day_12.load_pots_rules(puzzle_input)
+    transient, motion = settle_pots(pots, rules, day_12.MAX_STATES)
+    blocks = []
+
+    while len(blocks) < scale:
+        block = "".join(rng.choice("#.") for _ in state)
+        pots, _ = day_12.load_pots_rules([f"initial state: {block}"])
+
+        if pots and settle_pots(pots, rules, transient + 1)[1] == motion:
+            blocks.append(block)
+
+    gap = "." * (4 * (transient + motion[0]) + 4)
+
+    return [f"initial state: {gap.join(blocks)}", ""] + list(puzzle_input[2:])
+
+
+def generate_day_13(puzzle_input, scale, rng):
+    """Generate crossing track loops with carts on the largest network."""
+    side = int(len(puzzle_input) * math.sqrt(scale))
+    rows = rng.sample(range(side), side // 2 * 2)
+    columns = rng.sample(range(side), side // 2 * 2)
+    loops = [
+        (*sorted(rows[i : i + 2]), *sorted(columns[i : i + 2]))
+        for i in range(0, len(rows), 2)
+    ]
+    networks = find_networks(loops)
+    network = max(set(networks), key=networks.count)
+    grid = [[" "] * side for _ in range(side)]
+    straights = [
+        straight
+        for i, loop in enumerate(loops)
+        for straight in draw_loop(grid, *loop)
+        if networks[i] == network
+    ]
+    straights = [
+        (row, column, carts)
+        for row, column, carts in straights
+        if grid[row][column] != "+"
+    ]
+
+    for row, column, carts in rng.sample(
+        straights, min(len(straights), 17 * scale) // 2 * 2 - 1
+    ):
+        grid[row][column] = rng.choice(carts)
+
+    return ["".join(row) for row in grid]
+
+
+def generate_day_14(puzzle_input, scale, rng):
+    """Generate a proportionally larger number of recipes."""
+    del rng
+
+    return [str(int(puzzle_input[0]) * scale)]
+
+
+def generate_day_15(puzzle_input, scale, rng):
+    """Generate a larger cavern with proportionally more units."""
+    side = int(len(puzzle_input) * math.sqrt(scale))
+    grid = [
+        [
+            (
+                "#"
+                if i in (0, side - 1)
+                or j in (0, side - 1)
+                or rng.random() < 0.15
+                else "."
+            )
+            for j in range(side)
+        ]
+        for i in range(side)
+    ]
+    start = next(
+        (i, j)
+        for i, j in itertools.product(range(side), repeat=2)
+        if grid[i][j] == "."
+    )
+    reachable = {start}
+    queue = [start]
+
+    while queue:
+        i, j = queue.pop()
+
+        for k, l in ((i - 1, j), (i + 1, j), (i, j - 1), (i, j + 1)):
+            if grid[k][l] == "." and (k, l) not in reachable:
+                reachable.add((k, l))
+                queue.append((k, l))
+
+    for i, j in itertools.product(range(side), repeat=2):
+        if grid[i][j] == "." and (i, j) not in reachable:
+            grid[i][j] = "#"
+
+    for k, (i, j) in enumerate(rng.sample(sorted(reachable), 30 * scale)):
+        grid[i][j] = "E" if k % 3 == 0 else "G"
+
+    return ["".join(row) for row in grid]
+
+
+def generate_day_16(puzzle_input, scale, rng):
+    """Generate samples and test program under a random opcode mapping."""
+    opcodes = list(range(len(device.OPCODES)))
+    rng.shuffle(opcodes)
+    n_samples = sum("Before" in line for line in puzzle_input)
+    n_test = len(puzzle_input) - 4 * n_samples - 2
+    lines = []
+
+    for _ in range(n_samples * scale):
+        before = tuple(rng.randrange(4) for _ in range(4))
+        opcode = rng.randrange(len(opcodes))
+        a, b, c = (rng.randrange(4) for _ in range(3))
+        after = list(before)
+        device.execute(device.decode(opcodes[opcode], a, b, c), after)
+        lines.extend(
+            [
+                f"Before: {list(before)}",
+                f"{opcode} {a} {b} {c}",
+                f"After:  {list(after)}",
+                "",
+            ]
+        )
+
+    lines.extend(["", ""])
+    lines.extend(
+        f"{rng.randrange(len(opcodes))} {rng.randrange(4)} "
+        f"{rng.randrange(4)} {rng.randrange(4)}"
+        for _ in range(n_test * scale)
+    )
+
+    return lines
+
+
+def generate_day_17(puzzle_input, scale, rng):
+    """Generate a deeper ground scan with proportionally more buckets."""
+    depth = 1800 * scale
+    lines = []
+
+    for _ in range(len(puzzle_input) * scale // 3):
+        x = rng.randint(350, 650)
+        y = rng.randint(10, depth)
+        width = rng.randint(2, 30)
+        height = rng.randint(2, 20)
+        lines.extend(
+            [
+                f"x={x}, y={y - height}..{y}",
+                f"x={x + width}, y={y - height}..{y}",
+                f"y={y}, x={x}..{x + width}",
+            ]
+        )
+
+    return lines
+
+
+def generate_day_18(puzzle_input, scale, rng):
+    """Generate a larger lumber collection area."""
+    side = int(len(puzzle_input) * math.sqrt(scale))
+
+    return [
+        "".join(rng.choice("..||#") for _ in range(side)) for _ in range(side)
+    ]
+
+
+def generate_day_19(puzzle_input, scale, rng):
+    """Scale the number whose divisors the program sums."""
+    del rng
+    lines = list(puzzle_input)
+    i = next(i for i, line in enumerate(lines) if line.startswith("muli"))
+    opcode, a, b, c = lines[i].split()
+    lines[i] = f"{opcode} {a} {int(b) * scale} {c}"
+
+    return lines
+
+
+def generate_day_20(puzzle_input, scale, rng):
+    """Generate a longer regular expression nested as deep as the input."""
+    regex = puzzle_input[0]
+    max_depth = max(
+        itertools.accumulate((char == "(") - (char == ")") for char in regex)
+    )
+    length = len(regex) * scale
+    chunks = []
+    depth = 0
+
+    while len(chunks) < length or depth:
+        choice = rng.random()
+
+        if choice < 0.07 and depth < max_depth and len(chunks) < length:
+            chunks.append("(")
+            depth += 1
+        elif choice < 0.14 and depth:
+            chunks.append(")")
+            depth -= 1
+        elif choice < 0.21 and depth:
+            chunks.append("|")
+        else:
+            chunks.append(rng.choice("NSEW"))
+
+    return ["^" + "".join(chunks) + "$"]
+
+
+def generate_day_21(puzzle_input, scale, rng):
+    """Widen the hash mask so that its cycle grows with the scale."""
+    del rng
+    mask = 2 ** (24 + round(2 * math.log2(scale))) - 1
+
+    return [line.replace("16777215", str(mask)) for line in puzzle_input]
+
+
+def generate_day_22(puzzle_input, scale, rng):
+    """Generate a target farther away in both directions."""
+    del rng
+    x, y = map(int, puzzle_input[1].split()[-1].split(","))
+    factor = math.sqrt(scale)
+
+    return [puzzle_input[0], f"target: {int(x * factor)},{int(y * factor)}"]
+
+
+def generate_day_23(puzzle_input, scale, rng):
+    """Generate proportionally more nanobots."""
+    return [
+        f"pos=<{rng.randint(-10**8, 10**8)},{rng.randint(-10**8, 10**8)},"
+        f"{rng.randint(-10**8, 10**8)}>, r={rng.randint(5 * 10**7, 10**8)}"
+        for _ in range(len(puzzle_input) * scale)
+    ]
+
+
+def generate_day_24(puzzle_input, scale, rng):
+    """Generate armies with proportionally more groups."""
+    types = ("bludgeoning", "cold", "fire", "radiation", "slashing")
+    n_groups = (len(puzzle_input) - 3) // 2 * scale
+    initiatives = rng.sample(range(1, 2 * n_groups + 1), 2 * n_groups)
+    lines = []
+
+    for army, hit_points, damage in (
+        ("Immune System", 8000, 40),
+        ("Infection", 30000, 200),
+    ):
+        lines.append(f"{army}:")
+
+        for i in range(n_groups):
+            weak, immune = rng.sample(types, 2)
+            lines.append(
+                f"{rng.randint(50, 5000)} units each with "
+                f"{rng.randint(hit_points // 4, hit_points)} hit points "
+                f"(weak to {weak}; immune to {immune}) with an attack that "
+                f"does {rng.randint(2, damage)} {types[i % len(types)]} "
+                f"damage at initiative {initiatives.pop()}"
+            )
+
+        lines.append("")
+
+    return lines[:-1]
+
+
+def generate_day_25(puzzle_input, scale, rng):
+    """Generate points in a space growing with their number."""
+    side = int(8 * scale**0.25)
+
+    return [
+        ",".join(str(rng.randint(-side, side)) for _ in range(4))
+        for _ in range(len(puzzle_input) * scale)
+    ]
+
+
+def get_engines(day):
+    """Get the engines of a day, binding those of day 9 to its players."""
+    if day != 9:
+        return ENGINES[day]
+
+    players, _ = day_9.load_players_marbles(inputs.load(day))
+
+    return {
+        name: functools.partial(engine, players)
+        for name, engine in ENGINES[day].items()
+    }
+
+
+def settle_pots(pots, rules, limit):
+    """Find the transient and the period and drift of the cycle of pots."""
+    cycle = cycles.find_cycle(
+        pots, lambda state: day_12.spread(state, rules)[0], limit=limit
+    )
+
+    if cycle is None:
+        return None, None
+
+    transient, period = cycle
+    pots, _ = day_12.advance(pots, rules, transient)
+
+    return transient, (period, day_12.advance(pots, rules, period)[1])
+
+
+def time_star(function, puzzle_input, timeout):
+    """Time a star, returning its wall time or the reason it gave up."""
+    try:
+        with runner.time_limit(timeout):
+            result = runner.run_star(
+                None, None, function, puzzle_input, trace_memory=False
+            )
+    except TimeoutError:
+        return None, "timeout"
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        return None, type(error).__name__
+
+    return result.wall_time, None
+
+
+def write_input(day, scale, output):
+    """Write the synthetic input of a day at a given scale."""
+    path = os.path.join(output, f"day_{day}_{scale}x.txt")
+
+    if not os.path.exists(path):
+        puzzle_input = inputs.load(day)
+
+        if isinstance(puzzle_input, str):
+            puzzle_input = (puzzle_input,)
+
+        lines = GENERATORS[day](puzzle_input, scale, random.Random(day))
+
+        with open(path, "w", encoding="ascii") as output_file:
+            output_file.write("\n".join(lines) + "\n")
+
+    return path
+
+
+GENERATORS = {
+    int(name.split("_")[-1]): generator
+    for name, generator in dict(globals()).items()
+    if name.startswith("generate_day_")
+}
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Cycle detection in sequences of deterministic states"""
+
+__author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
+__date__ = "2025"
+__license__ = "MIT"
+
+
+def find_cycle(state, step, fingerprint=None, limit=None):
+    """Find start and length of a cycle remembering up to limit states."""
+    seen = {}
+    generation = 0
+    key = state if fingerprint is None else fingerprint(state)
+
+    while key not in seen:
+        if limit is not None and generation >= limit:
+            return None
+
+        seen[key] = generation
+        state = step(state)
+        generation += 1
+        key = state if fingerprint is None else fingerprint(state)
+
+    return seen[key], generation - seen[key]
+
+
+def find_cycle_brent(state, step, limit=None):
+    """Find start and length of a cycle within limit steps with Brent."""
+    power = length = 1
+    tortoise = state
+    hare = step(state)
+
+    while tortoise != hare:
+        if power == length:
+            if limit is not None and power >= limit:
+                return None
+
+            tortoise = hare
+            power *= 2
+            length = 0
+
+        hare = step(hare)
+        length += 1
+
+    tortoise = hare = state
+
+    for _ in range(length):
+        hare = step(hare)
+
+    start = 0
+
+    while tortoise != hare:
+        tortoise = step(tortoise)
+        hare = step(hare)
+        start += 1
+
+    return start, length
@@ -4,11 +4,12 @@ __author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
 __date__ = "2025"
 __license__ = "MIT"
 
+import inputs
+
 
 def main():
     """Solve day 1 puzzles."""
-    with open("data/day_1.txt", encoding="ascii") as input_file:
-        puzzle_input = tuple(line.rstrip() for line in input_file.readlines())
+    puzzle_input = inputs.load(1)
 
     print(star_1(puzzle_input))
     print(star_2(puzzle_input))
@@ -16,15 +17,15 @@ def main():
 
 def star_1(puzzle_input):
     """Solve first puzzle."""
-    return sum(int(line) for line in puzzle_input)
+    return sum(inputs.integers(puzzle_input))
 
 
 def star_2(puzzle_input):
     """Solve second puzzle."""
     base_frequencies = [0]
 
-    for line in puzzle_input:
-        base_frequencies.append(base_frequencies[-1] + int(line))
+    for change in inputs.integers(puzzle_input):
+        base_frequencies.append(base_frequencies[-1] + change)
 
     offset = base_frequencies[-1]
     base_frequencies.pop(-1)
@@ -7,6 +7,8 @@ __license__ = "MIT"
 import re
 from dataclasses import dataclass
 
+import inputs
+
 
 @dataclass
 class Point:
@@ -18,8 +20,7 @@ class Point:
 
 def main():
     """Solve day 10 puzzles."""
-    with open("data/day_10.txt", encoding="ascii") as input_file:
-        puzzle_input = tuple(line.rstrip() for line in input_file.readlines())
+    puzzle_input = inputs.load(10)
 
     star_1(puzzle_input)
     print(star_2(puzzle_input))
@@ -4,13 +4,20 @@ __author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
 __date__ = "2025"
 __license__ = "MIT"
 
+import functools
 import itertools
+import operator
+from concurrent.futures import ProcessPoolExecutor
+
+import inputs
+
+GRID_SIZE = 300
+POWER_DIGITS = [n % 1000 // 100 - 5 for n in range(2000)]
 
 
 def main():
     """Solve day 11 puzzles."""
-    with open("data/day_11.txt", encoding="ascii") as input_file:
-        puzzle_input = input_file.read().rstrip()
+    puzzle_input = inputs.load(11)
 
     print(star_1(puzzle_input))
     print(star_2(puzzle_input))
@@ -18,84 +25,98 @@ def main():
 
 def star_1(puzzle_input):
     """Solve first puzzle."""
-    table = generate_summed_area_table(int(puzzle_input))
-    squares = {
-        f"{i},{j}": compute_square_power(i + j * 1j, 3, table)
-        for i, j in itertools.product(range(1, 299), repeat=2)
-    }
+    table = generate_summed_area_table(int(puzzle_input), compute_terms())
+    _, x, y = find_best_square(table, 3)
 
-    return max(squares, key=squares.get)
+    return f"{x},{y}"
 
 
 def star_2(puzzle_input):
     """Solve second puzzle."""
-    table = generate_summed_area_table(int(puzzle_input))
-    squares = {}
+    _, x, y, size = solve_serial_number(int(puzzle_input), compute_terms())
 
-    for size in range(1, 301):
-        size_squares = {
-            f"{i},{j},{size}": compute_square_power(i + j * 1j, size, table)
-            for i, j in itertools.product(range(1, 302 - size), repeat=2)
-        }
-        squares |= size_squares
+    return f"{x},{y},{size}"
 
-        if max(size_squares.values()) < 0:
-            break
 
-    return max(squares, key=squares.get)
+@functools.cache
+def compute_terms(grid_size=GRID_SIZE):
+    """Compute the (x + 10) ** 2 * y part of each power level, modulo 1000."""
+    return tuple(
+        tuple((x + 10) ** 2 * y % 1000 for x in range(1, grid_size + 1))
+        for y in range(1, grid_size + 1)
+    )
 
 
-def compute_power_level(cell, serial_number):
-    """Compute the power level of a cell."""
-    return (
-        int(((cell.real + 10) * cell.imag + serial_number) * (cell.real + 10))
-        % 1000
-        // 100
-        - 5
-    )
+def find_best_any_square(table):
+    """Find power, corner and size of the most powerful square."""
+    best = (float("-inf"),)
 
+    for size in range(1, len(table)):
+        power, x, y = find_best_square(table, size)
 
-def compute_square_power(cell, size, table):
-    """Compute the power of a square with given cell and size."""
-    cell -= 1 + 1j
+        if power > best[0]:
+            best = power, x, y, size
 
-    return (
-        table.get(cell, 0)
-        + table[cell + size * (1 + 1j)]
-        - table.get(cell + size, 0)
-        - table.get(cell + size * 1j, 0)
-    )
+        if power < 0:
+            break
 
+    return best
 
-def compute_summed_area(cell, serial_number, table):
-    """Compute the value of the summed-area table for a given cell."""
-    return (
-        compute_power_level(cell, serial_number)
-        + table.get(cell - 1j, 0)
-        + table.get(cell - 1, 0)
-        - table.get(cell - 1 - 1j, 0)
-    )
 
+def find_best_square(table, size):
+    """Find power and top-left corner of the best square of given size."""
+    best = float("-inf"), 0, 0
+
+    for y in range(len(table) - size):
+        strip = list(map(operator.sub, table[y + size], table[y]))
+        powers = list(map(operator.sub, strip[size:], strip[:-size]))
+        power = max(powers)
+        x = powers.index(power) + 1
+
+        if (power, -x) > (best[0], -best[1]):
+            best = power, x, y + 1
 
-def generate_summed_area_table(serial_number):
-    """Generate the summed-area table."""
-    table = {}
+    return best
 
-    for size in range(1, 301):
-        for k in range(1, size):
-            table[size + k * 1j] = compute_summed_area(
-                size + k * 1j, serial_number, table
-            )
-            table[k + size * 1j] = compute_summed_area(
-                k + size * 1j, serial_number, table
-            )
 
-        table[size + size * 1j] = compute_summed_area(
-            size + size * 1j, serial_number, table
+def generate_summed_area_table(serial_number, terms):
+    """Generate the zero-padded summed-area table as a list of rows."""
+    offsets = [
+        serial_number * (x + 10) % 1000 for x in range(1, len(terms) + 1)
+    ]
+    table = [[0] * (len(terms) + 1)]
+
+    for terms_row in terms:
+        row = itertools.accumulate(
+            map(
+                POWER_DIGITS.__getitem__, map(operator.add, terms_row, offsets)
+            ),
+            initial=0,
         )
+        table.append(list(map(operator.add, row, table[-1])))
 
     return table
 
 
+def solve_serial_number(serial_number, terms):
+    """Find power, corner and size of the best square for a serial number."""
+    return find_best_any_square(
+        generate_summed_area_table(serial_number, terms)
+    )
+
+
+def solve_serial_numbers(serial_numbers, grid_size=GRID_SIZE, jobs=1):
+    """Find the best square for each serial number, possibly in parallel."""
+    solve = functools.partial(
+        solve_serial_number, terms=compute_terms(grid_size)
+    )
+
+    if jobs == 1:
+        return list(map(solve, serial_numbers))
+
+    with ProcessPoolExecutor(jobs or None) as executor:
+        return list(executor.map(solve, serial_numbers, chunksize=16))
+
+
 if __name__ == "__main__":
     main()
@@ -4,13 +4,18 @@ __author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
 __date__ = "2025"
 __license__ = "MIT"
 
+import cycles
+import inputs
+
 GENERATIONS = 50000000000
+MAX_GENERATIONS = 1 << 16
+MAX_STATES = 1 << 12
+PLANT_BITS = str.maketrans("#.", "10")
 
 
 def main():
     """Solve day 12 puzzles."""
-    with open("data/day_12.txt", encoding="ascii") as input_file:
-        puzzle_input = tuple(line.rstrip() for line in input_file.readlines())
+    puzzle_input = inputs.load(12)
 
     print(star_1(puzzle_input))
     print(star_2(puzzle_input))
@@ -19,87 +24,99 @@ def main():
 def star_1(puzzle_input):
     """Solve first puzzle."""
     pots, rules = load_pots_rules(puzzle_input)
+    pots, offset = advance(pots, rules, 20)
 
-    for _ in range(20):
-        pots = spread(pots, rules)
-
-    return sum(pots)
+    return compute_pot_sum(pots, offset)
 
 
 def star_2(puzzle_input):
     """Solve second puzzle."""
     pots, rules = load_pots_rules(puzzle_input)
+    start, length = find_pots_cycle(pots, rules)
+
+    pots, offset = advance(pots, rules, start)
+    n_cycles, generations = divmod(GENERATIONS - start, length)
+    _, cycle_offset = advance(pots, rules, length)
+    pots, shift = advance(pots, rules, generations)
+
+    return compute_pot_sum(pots, offset + n_cycles * cycle_offset + shift)
 
-    offset = min(pots)
-    pots = {pot - offset for pot in pots}
-    states = [(pots, offset)]
 
-    for _ in range(GENERATIONS):
-        pots = spread(states[-1][0], rules)
-        offset = min(pots)
-        pots = {pot - offset for pot in pots}
+def advance(pots, rules, generations):
+    """Perform several spread rounds, returning pots and total shift."""
+    offset = 0
 
-        if (pots, offset) in states:
-            break
+    for _ in range(generations):
+        pots, shift = spread(pots, rules)
+        offset += shift
 
-        states.append((pots, offset))
+    return pots, offset
 
-    i = states.index((pots, offset))
-    base_offset = sum(state[1] for state in states[:i])
-    states = states[i:]
-    generations = GENERATIONS - i
-    len_cycle = len(states)
 
-    pots = states[generations % len_cycle][0]
-    offset = (
-        base_offset
-        + sum(state[1] for state in states) * generations // len_cycle
-        + states[generations % len_cycle][1]
+def compute_pot_sum(pots, offset):
+    """Compute the sum of the numbers of pots with plants."""
+    return (
+        sum(i for i, pot in enumerate(reversed(bin(pots))) if pot == "1")
+        + offset * pots.bit_count()
     )
 
-    return sum(pots) + offset * len(pots)
 
+def find_pots_cycle(pots, rules, limit=MAX_STATES):
+    """Find a cycle of pots, falling back to Brent for long transients."""
+
+    def step(state):
+        return spread(state[0], rules)
+
+    cycle = cycles.find_cycle((pots, 0), step, limit=limit) or (
+        cycles.find_cycle_brent((pots, 0), step, limit=MAX_GENERATIONS)
+    )
 
-def apply(condition, pots, i):
-    """Check if condition applies to pot."""
-    for j in range(-2, 3):
-        if (j in condition) != (i + j in pots):
-            return False
+    if cycle is None:
+        raise ValueError(
+            f"pots do not repeat within {MAX_GENERATIONS} generations"
+        )
 
-    return True
+    return cycle
 
 
 def load_pots_rules(puzzle_input):
-    """Load initial pots and rules from input."""
-    pots = {
-        i for i, pot in enumerate(puzzle_input[0].split()[-1]) if pot == "#"
-    }
+    """Load initial pots bitmask and rule lookup table from input."""
+    pots = int(
+        puzzle_input[0].split()[-1][::-1].translate(PLANT_BITS),
+        2,
+    )
 
-    rules = {}
+    rules = [i >> 2 & 1 for i in range(32)]
 
     for line in puzzle_input[2:]:
         condition, result = line.split(" => ")
-        rules[
-            tuple(i - 2 for i, pot in enumerate(condition) if pot == "#")
-        ] = (1 if result == "#" else 0)
+        rules[int(condition[::-1].translate(PLANT_BITS), 2)] = (
+            1 if result == "#" else 0
+        )
 
     return pots, rules
 
 
 def spread(pots, rules):
-    """Perform a spread round on pots."""
-    new_pots = pots.copy()
-
-    for i in range(min(pots) - 2, max(pots) + 3):
-        for condition, result in rules.items():
-            if apply(condition, pots, i):
-                if result == 1:
-                    new_pots.add(i)
-                elif result == 0:
-                    new_pots.discard(i)
-                break
-
-    return new_pots
+    """Perform a spread round on pots, returning them and their shift."""
+    pots <<= 4
+    width = pots.bit_length() + 4
+    full = (1 << width) - 1
+    windows = [((pots >> j) & full, ~(pots >> j) & full) for j in range(5)]
+    new_pots = 0
+
+    for rule, result in enumerate(rules):
+        if result:
+            match = full
+
+            for j, (plants, empty) in enumerate(windows):
+                match &= plants if rule >> j & 1 else empty
+
+            new_pots |= match
+
+    shift = (new_pots & -new_pots).bit_length() - 1
+
+    return new_pots >> shift, shift - 2
 
 
 if __name__ == "__main__":
@@ -4,24 +4,66 @@ __author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
 __date__ = "2025"
 __license__ = "MIT"
 
-from dataclasses import dataclass
+import heapq
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
 
-TURN_ORDER = {1j: 1, 1: -1j, -1j: 1j}
+import inputs
+
+CORNER = re.compile("/")
+DIRECTIONS = {"^": (-1, 0), "v": (1, 0), "<": (0, -1), ">": (0, 1)}
+DOWN_RIGHT = frozenset(((1, 0), (0, 1)))
+JUNCTION = re.compile(r"\+")
+TRACKS = {"^": "|", "v": "|", "<": "-", ">": "-"}
 
 
 @dataclass
 class Cart:
     """Cart."""
 
-    position: complex
-    direction: complex
-    turn: complex = 1j
+    row: int
+    column: int
+    d_row: int
+    d_column: int
+    turn: int = 0
+
+
+@dataclass
+class Leg:
+    """Run of a cart along a segment up to the junction ending it."""
+
+    segment: int
+    index: int
+    orientation: int
+    start: int
+    end: int
+
+
+@dataclass
+class TrackGraph:
+    """Track segments joining junctions, with their entry points."""
+
+    tracks: list
+    segments: list = field(default_factory=list)
+    entries: dict = field(default_factory=dict)
+    forward: list = field(default_factory=list)
+    backward: list = field(default_factory=list)
+
+
+@dataclass
+class Traffic:
+    """Current legs, junction visits and pending events of carts."""
+
+    legs: dict = field(default_factory=dict)
+    segments: defaultdict = field(default_factory=lambda: defaultdict(list))
+    visits: defaultdict = field(default_factory=lambda: defaultdict(dict))
+    events: list = field(default_factory=list)
 
 
 def main():
     """Solve day 13 puzzles."""
-    with open("data/day_13.txt", encoding="ascii") as input_file:
-        puzzle_input = tuple(line.rstrip() for line in input_file.readlines())
+    puzzle_input = inputs.load(13)
 
     print(star_1(puzzle_input))
     print(star_2(puzzle_input))
@@ -35,82 +77,328 @@ def star_1(puzzle_input):
     while not crashed:
         carts, crashed = move_carts(carts, tracks, crashed)
 
-    y, x = map(int, (crashed[0].position.real, crashed[0].position.imag))
-
-    return f"{x},{y}"
+    return f"{crashed[0].column},{crashed[0].row}"
 
 
 def star_2(puzzle_input):
     """Solve second puzzle."""
+    return find_last_cart(puzzle_input)
+
+
+def add_segment(graph, nodes, node, direction):
+    """Walk the segment leaving a junction in a direction."""
+    cells = [node]
+    cart = Cart(*node, *direction)
+
+    while len(cells) == 1 or cells[-1] not in nodes:
+        move_cart(cart, graph.tracks)
+        cells.append((cart.row, cart.column))
+
+    segment = len(graph.segments)
+    graph.segments.append(cells)
+    forward = [None] * len(cells)
+    backward = [None] * len(cells)
+
+    for k in range(len(cells) - 1):
+        step = cells[k + 1][0] - cells[k][0], cells[k + 1][1] - cells[k][1]
+        graph.entries[*cells[k], *step] = segment, k, 1
+        graph.entries[*cells[k + 1], -step[0], -step[1]] = segment, k + 1, -1
+        backward[k + 1] = k + 1 if step not in DOWN_RIGHT else backward[k]
+
+    for k in reversed(range(len(cells) - 1)):
+        step = cells[k + 1][0] - cells[k][0], cells[k + 1][1] - cells[k][1]
+        forward[k] = k if step in DOWN_RIGHT else forward[k + 1]
+
+    graph.forward.append(forward)
+    graph.backward.append(backward)
+
+
+def build_track_graph(tracks):
+    """Split tracks into segments joining junctions and loop anchors."""
+    graph = TrackGraph(tracks)
+    nodes = {
+        (i, match.start())
+        for i, line in enumerate(tracks)
+        for match in JUNCTION.finditer(line)
+    }
+
+    for node in sorted(nodes):
+        for direction in DIRECTIONS.values():
+            if (*node, *direction) not in graph.entries:
+                add_segment(graph, nodes, node, direction)
+
+    for i, line in enumerate(tracks):
+        for match in CORNER.finditer(line):
+            anchor = i, match.start()
+
+            if not {(*anchor, 0, 1), (*anchor, 0, -1)} & graph.entries.keys():
+                nodes.add(anchor)
+                add_segment(graph, nodes, anchor, (0, 1))
+
+    return graph
+
+
+def find_crashes(carts, graph):
+    """Yield tick, position and surviving legs of each crash in order."""
+    traffic = Traffic()
+
+    for i, cart in enumerate(carts):
+        register_leg(graph, traffic, i, start_leg(graph, cart, 0))
+
+    while traffic.events:
+        tick, arrival, _, i, j, position = heapq.heappop(traffic.events)
+
+        if i not in traffic.legs or j not in traffic.legs:
+            continue
+
+        if not arrival:
+            del traffic.legs[i], traffic.legs[j]
+
+            yield tick, position, traffic.legs
+
+            continue
+
+        leg = traffic.legs[i]
+        row, column = get_cell(graph, leg, tick)
+        previous_row, previous_column = get_cell(graph, leg, tick - 1)
+        cart = carts[i]
+        cart.row, cart.column = row, column
+        cart.d_row, cart.d_column = (
+            row - previous_row,
+            column - previous_column,
+        )
+        steer(cart, graph.tracks[row][column])
+
+        register_leg(graph, traffic, i, start_leg(graph, cart, tick))
+
+
+def find_follower_crash(graph, segment, rear, orientation, bounds):
+    """Find when a cart runs into the one just ahead on a segment."""
+    if orientation == 1:
+        k = graph.forward[segment][rear]
+    else:
+        k = graph.backward[segment][rear]
+
+    if k is None or bounds[0] + abs(k - rear) >= bounds[1]:
+        return None
+
+    cells = graph.segments[segment]
+
+    return bounds[0] + abs(k - rear) + 1, cells[k], cells[k + orientation]
+
+
+def find_head_on_crash(graph, segment, indices, bounds):
+    """Find when carts running towards each other on a segment crash."""
+    gap = indices[1] - indices[0]
+    steps = (gap - 1) // 2
+
+    if gap <= 0 or bounds[0] + steps >= bounds[1]:
+        return None
+
+    cells = graph.segments[segment]
+    first, second = cells[indices[0] + steps], cells[indices[1] - steps]
+
+    if gap % 2 == 0:
+        return (
+            bounds[0] + steps + 1,
+            max(first, second),
+            cells[indices[0] + steps + 1],
+        )
+
+    return bounds[0] + steps + 1, min(first, second), max(first, second)
+
+
+def find_leg_crash(graph, leg, other):
+    """Find tick, mover and position of a crash between legs of a segment."""
+    bounds = max(leg.start, other.start), min(leg.end, other.end)
+
+    if bounds[1] <= bounds[0]:
+        return None
+
+    index = leg.index + leg.orientation * (bounds[0] - leg.start)
+    other_index = other.index + other.orientation * (bounds[0] - other.start)
+
+    if leg.orientation != other.orientation:
+        if leg.orientation == -1:
+            index, other_index = other_index, index
+
+        return find_head_on_crash(
+            graph, leg.segment, (index, other_index), bounds
+        )
+
+    if other_index - index == leg.orientation:
+        return find_follower_crash(
+            graph, leg.segment, index, leg.orientation, bounds
+        )
+
+    if index - other_index == leg.orientation:
+        return find_follower_crash(
+            graph, leg.segment, other_index, leg.orientation, bounds
+        )
+
+    return None
+
+
+def find_visit_crash(node, visit, other):
+    """Find tick and mover of a crash between two visits of a junction."""
+    time, (d_row, d_column) = visit
+    other_time, (other_d_row, other_d_column) = other
+    previous = node[0] - d_row, node[1] - d_column
+    other_previous = node[0] - other_d_row, node[1] - other_d_column
+
+    if other_time == time:
+        return time, max(previous, other_previous), node
+
+    if other_time == time - 1 and previous < node:
+        return time, previous, node
+
+    if other_time == time + 1 and other_previous < node:
+        return other_time, other_previous, node
+
+    return None
+
+
+def find_last_cart(puzzle_input):
+    """Find where the last cart is, moving all carts one cell per tick."""
     carts, tracks = load_map(puzzle_input)
     crashed = []
 
     while len(carts) > 1:
         carts, crashed = move_carts(carts, tracks, crashed)
 
-    y, x = map(int, (carts[0].position.real, carts[0].position.imag))
+    return f"{carts[0].column},{carts[0].row}"
+
+
+def find_last_cart_graph(puzzle_input):
+    """Find where the last cart is, skipping carts between junctions."""
+    carts, tracks = load_map(puzzle_input)
+
+    if len(carts) == 1:
+        return f"{carts[0].column},{carts[0].row}"
+
+    graph = build_track_graph(tracks)
+
+    for tick, _, legs in find_crashes(carts, graph):
+        if len(legs) == 1:
+            row, column = get_cell(graph, *legs.values(), tick)
+
+            return f"{column},{row}"
+
+    return None
 
-    return f"{x},{y}"
+
+def get_cell(graph, leg, time):
+    """Get the cell where a cart on a leg is at a given time."""
+    return graph.segments[leg.segment][
+        leg.index + leg.orientation * (time - leg.start)
+    ]
 
 
 def load_map(puzzle_input):
-    """Load map from input."""
+    """Load carts and grid of tracks from input."""
     carts = []
-    tracks = {}
+    tracks = []
 
     for i, line in enumerate(puzzle_input):
         for j, char in enumerate(line):
-            coordinates = i + j * 1j
-
-            if char == "^":
-                carts.append(Cart(coordinates, -1))
-                tracks[coordinates] = "|"
-            elif char == "v":
-                carts.append(Cart(coordinates, 1))
-                tracks[coordinates] = "|"
-            elif char == "<":
-                carts.append(Cart(coordinates, -1j))
-                tracks[coordinates] = "-"
-            elif char == ">":
-                carts.append(Cart(coordinates, 1j))
-                tracks[coordinates] = "-"
-            elif char:
-                tracks[coordinates] = char
+            if char in DIRECTIONS:
+                carts.append(Cart(i, j, *DIRECTIONS[char]))
+
+        tracks.append("".join(TRACKS.get(char, char) for char in line))
 
     return carts, tracks
 
 
 def move_cart(cart, tracks):
     """Move a single cart on tracks."""
-    cart.position += cart.direction
-
-    match tracks[cart.position]:
-        case "/":
-            cart.direction = -(cart.direction.imag + cart.direction.real * 1j)
-        case "\\":
-            cart.direction = cart.direction.imag + cart.direction.real * 1j
-        case "+":
-            cart.direction *= cart.turn
-            cart.turn = TURN_ORDER[cart.turn]
+    cart.row += cart.d_row
+    cart.column += cart.d_column
+    steer(cart, tracks[cart.row][cart.column])
 
     return cart
 
 
 def move_carts(carts, tracks, crashed):
-    """Move carts on tracks."""
-    crash_indices = []
+    """Move carts on tracks in reading order for one tick."""
+    carts.sort(key=lambda cart: (cart.row, cart.column))
+    positions = {(cart.row, cart.column): cart for cart in carts}
 
-    for i, cart in enumerate(carts):
-        carts[i] = move_cart(cart, tracks)
+    for cart in carts:
+        if positions.get((cart.row, cart.column)) is not cart:
+            continue
+
+        del positions[cart.row, cart.column]
+        move_cart(cart, tracks)
+
+        if (cart.row, cart.column) in positions:
+            crashed.extend((positions.pop((cart.row, cart.column)), cart))
+        else:
+            positions[cart.row, cart.column] = cart
+
+    return list(positions.values()), crashed
+
+
+def register_leg(graph, traffic, i, leg):
+    """Record a new leg of a cart and schedule its crashes and arrival."""
+    traffic.legs[i] = leg
+    running = traffic.segments[leg.segment]
+    running[:] = [
+        (j, other)
+        for j, other in running
+        if traffic.legs.get(j) is other and other.end > leg.start
+    ]
+    crashes = [(find_leg_crash(graph, leg, other), j) for j, other in running]
+    running.append((i, leg))
 
-        for j, _ in enumerate(carts):
-            if i != j and carts[i].position == carts[j].position:
-                crash_indices.extend([i, j])
+    node = get_cell(graph, leg, leg.end)
+    previous = get_cell(graph, leg, leg.end - 1)
+    visit = leg.end, (node[0] - previous[0], node[1] - previous[1])
+    visits = traffic.visits[node]
 
-    crashed.extend([carts[i] for i in crash_indices])
-    carts = [cart for i, cart in enumerate(carts) if i not in crash_indices]
+    for time in [time for time in visits if time < leg.start]:
+        del visits[time]
+
+    for time in range(leg.end - 1, leg.end + 2):
+        for j, direction in visits.get(time, ()):
+            crashes.append(
+                (find_visit_crash(node, visit, (time, direction)), j)
+            )
+
+    visits.setdefault(leg.end, []).append((i, visit[1]))
+
+    for crash, j in crashes:
+        if crash is not None:
+            heapq.heappush(
+                traffic.events, (crash[0], False, crash[1], i, j, crash[2])
+            )
+
+    heapq.heappush(traffic.events, (leg.end, True, (), i, i, None))
+
+
+def start_leg(graph, cart, time):
+    """Start the leg of a cart leaving its cell at a given time."""
+    segment, index, orientation = graph.entries[
+        cart.row, cart.column, cart.d_row, cart.d_column
+    ]
+    end = len(graph.segments[segment]) - 1 if orientation == 1 else 0
+
+    return Leg(segment, index, orientation, time, time + abs(end - index))
+
+
+def steer(cart, track):
+    """Turn a cart according to the track it has just entered."""
+    match track:
+        case "/":
+            cart.d_row, cart.d_column = -cart.d_column, -cart.d_row
+        case "\\":
+            cart.d_row, cart.d_column = cart.d_column, cart.d_row
+        case "+":
+            if cart.turn == 0:
+                cart.d_row, cart.d_column = -cart.d_column, cart.d_row
+            elif cart.turn == 2:
+                cart.d_row, cart.d_column = cart.d_column, -cart.d_row
 
-    return carts, crashed
+            cart.turn = (cart.turn + 1) % 3
 
 
 if __name__ == "__main__":
@@ -4,13 +4,26 @@ __author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
 __date__ = "2025"
 __license__ = "MIT"
 
-from functools import cache
+from dataclasses import dataclass, field
+
+import inputs
+
+CHUNK = 1 << 16
+SUMS = tuple(bytes(map(int, str(total))) for total in range(19))
+
+
+@dataclass
+class Scoreboard:
+    """Scores of recipes as digits and current recipes of the elves."""
+
+    recipes: bytearray = field(default_factory=lambda: bytearray((3, 7)))
+    elf_0: int = 0
+    elf_1: int = 1
 
 
 def main():
     """Solve day 14 puzzles."""
-    with open("data/day_14.txt", encoding="ascii") as input_file:
-        puzzle_input = input_file.read().rstrip()
+    puzzle_input = inputs.load(14)
 
     print(star_1(puzzle_input))
     print(star_2(puzzle_input))
@@ -19,35 +32,47 @@ def main():
 def star_1(puzzle_input):
     """Solve first puzzle."""
     number = int(puzzle_input)
-    recipes = "37"
-    elf_0 = 0
-    elf_1 = 1
+    scoreboard = Scoreboard()
+    extend_scoreboard(scoreboard, number + 10)
 
-    while len(recipes) < number + 10:
-        recipes += create_recipe(recipes[elf_0], recipes[elf_1])
-        elf_0 = (elf_0 + 1 + int(recipes[elf_0])) % len(recipes)
-        elf_1 = (elf_1 + 1 + int(recipes[elf_1])) % len(recipes)
-
-    return recipes[number : number + 10]
+    return "".join(map(str, scoreboard.recipes[number : number + 10]))
 
 
 def star_2(puzzle_input):
     """Solve second puzzle."""
-    recipes = "37"
-    elf_0 = 0
-    elf_1 = 1
+    target = bytes(map(int, puzzle_input))
+    scoreboard = Scoreboard()
+    start = 0
+
+    while (index := scoreboard.recipes.find(target, start)) == -1:
+        start = max(len(scoreboard.recipes) - len(target) + 1, 0)
+        extend_scoreboard(scoreboard, len(scoreboard.recipes) + CHUNK)
+
+    return index
+
+
+def extend_scoreboard(scoreboard, length):
+    """Create recipes until the scoreboard holds at least length of them."""
+    recipes, elf_0, elf_1 = (
+        scoreboard.recipes,
+        scoreboard.elf_0,
+        scoreboard.elf_1,
+    )
 
-    while puzzle_input not in recipes[-len(puzzle_input) - 1 :]:
-        recipes += create_recipe(recipes[elf_0], recipes[elf_1])
-        elf_0 = (elf_0 + 1 + int(recipes[elf_0])) % len(recipes)
-        elf_1 = (elf_1 + 1 + int(recipes[elf_1])) % len(recipes)
+    while len(recipes) < length:
+        score_0 = recipes[elf_0]
+        score_1 = recipes[elf_1]
+        recipes += SUMS[score_0 + score_1]
+        elf_0 += 1 + score_0
+        elf_1 += 1 + score_1
 
-    return recipes.index(puzzle_input)
+        if elf_0 >= len(recipes):
+            elf_0 %= len(recipes)
 
+        if elf_1 >= len(recipes):
+            elf_1 %= len(recipes)
 
-@cache
-def create_recipe(recipe_0, recipe_1):
-    return str(int(recipe_0) + int(recipe_1))
+    scoreboard.elf_0, scoreboard.elf_1 = elf_0, elf_1
 
 
 if __name__ == "__main__":
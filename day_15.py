@@ -4,25 +4,35 @@ __author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
 __date__ = "2025"
 __license__ = "MIT"
 
-import copy
-from collections import defaultdict, deque
+import contextlib
+import functools
+import operator
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from functools import cache
 
+import inputs
 
-@dataclass
+ENEMIES = {"E": "G", "G": "E"}
+POINTS = 200
+WALL = "#"
+
+
+@dataclass(slots=True)
 class Unit:
     """Unit."""
 
     race: str
+    position: int
     attack: int = 3
-    points: int = 200
+    points: int = POINTS
 
 
 def main():
     """Solve day 15 puzzles."""
-    with open("data/day_15.txt", encoding="ascii") as input_file:
-        puzzle_input = tuple(line.rstrip() for line in input_file.readlines())
+    puzzle_input = inputs.load(15)
 
     print(star_1(puzzle_input))
     print(star_2(puzzle_input))
@@ -30,174 +40,202 @@ def main():
 
 def star_1(puzzle_input):
     """Solve first puzzle."""
-    units, caverns = load_map(puzzle_input)
-    over = False
-    turn = -1
+    rounds, units = fight_battle(load_map(puzzle_input))
 
-    while not over:
-        turn += 1
-        units, over = play_turn(units, caverns)
-
-    return turn * sum(unit.points for unit in units.values())
+    return rounds * sum(unit.points for unit in units)
 
 
 def star_2(puzzle_input):
     """Solve second puzzle."""
-    units, caverns = load_map(puzzle_input)
-    new_units = {}
-
-    while len(new_units) == 0:
-        for unit in units.values():
-            if unit.race == "E":
-                unit.attack += 1
+    rounds, units = search_elf_attack(load_map(puzzle_input))
 
-        new_units, turn = fight_battle(units, caverns)
+    return rounds * sum(unit.points for unit in units)
 
-    return turn * sum(unit.points for unit in new_units.values())
 
-
-def attack(location, units):
-    """Make unit attack."""
-    enemies = get_enemies(location, units)
+def attack(unit, cells, width, counts):
+    """Make unit attack its weakest neighboring enemy."""
+    enemies = get_enemies(unit, cells, width)
 
     if enemies:
-        target = min(enemies, key=lambda enemy: units[enemy].points)
-        units[target].points -= units[location].attack
-
-        if units[target].points <= 0:
-            del units[target]
-
-    return units
-
+        target = min(enemies, key=lambda enemy: enemy.points)
+        target.points -= unit.attack
 
-def count_elves(units):
-    """Count the number of elves."""
-    return sum(1 for unit in units.values() if unit.race == "E")
+        if target.points <= 0:
+            cells[target.position] = None
+            counts[target.race] -= 1
 
 
-def fight_battle(units, caverns):
-    """Fight a whole battle."""
-    elves = count_elves(units)
-    units = copy.deepcopy(units)
-    over = False
-    turn = -1
+def fight_battle(cave, elf_attack=3, elves_must_survive=False):
+    """Fight a battle, returning full rounds and survivors or None."""
+    specs, template, width = cave
+    cells = list(template)
+    units = [
+        Unit(race, position, elf_attack if race == "E" else 3)
+        for race, position in specs
+    ]
 
-    while not over:
-        turn += 1
-        units, over = play_turn(units, caverns)
+    for unit in units:
+        cells[unit.position] = unit
 
-        if count_elves(units) < elves:
-            return {}, 0
+    counts = Counter(unit.race for unit in units)
+    elves = counts["E"] if elves_must_survive else 0
+    rounds = 0
 
-    return units, turn
+    while play_round(units, cells, width, counts, elves):
+        rounds += 1
+        units = [unit for unit in units if unit.points > 0]
 
+    if counts["E"] < elves:
+        return None
 
-def get_enemies(location, units):
-    """Get neighboring enemies."""
-    return tuple(
-        neighbor
-        for neighbor in get_neighbors(location)
-        if neighbor in units and units[neighbor].race != units[location].race
-    )
-
-
-@cache
-def get_neighbors(location):
-    """Get all neighbors to a location."""
-    return tuple(location + direction for direction in (-1, -1j, 1j, 1))
-
-
-@cache
-def get_path(start, end, free):
-    """Get shortest path from start to end."""
-    paths = deque([[start]])
-    visited = {start}
+    return rounds, [unit for unit in units if unit.points > 0]
 
-    while paths:
-        path = paths.popleft()
 
-        for neighbor in get_neighbors(path[-1]):
-            if neighbor == end:
-                return tuple(path[1:] + [neighbor])
+def find_step(start, targets, cells, width):
+    """Find the first step towards the nearest target in reading order."""
+    offsets = (-width, -1, 1, width)
+    frontier = [start + offset for offset in offsets]
+    frontier = [cell for cell in frontier if cells[cell] is None]
+    steps = {cell: cell for cell in frontier}
 
-            if neighbor in free and neighbor not in visited:
-                visited.add(neighbor)
-                paths.append(path + [neighbor])
+    while frontier:
+        reached = [cell for cell in frontier if cell in targets]
 
-    return tuple()
+        if reached:
+            return steps[min(reached)]
 
+        layer = []
 
-def load_map(puzzle_input):
-    """Load map from input."""
-    units = {}
-    caverns = set()
+        for cell in frontier:
+            step = steps[cell]
 
-    for i, line in enumerate(puzzle_input):
-        for j, char in enumerate(line):
-            if char in ("G", "E"):
-                units[i + j * 1j] = Unit(char)
+            for offset in offsets:
+                neighbor = cell + offset
 
-            if char != "#":
-                caverns.add(i + j * 1j)
+                if cells[neighbor] is None and neighbor not in steps:
+                    steps[neighbor] = step
+                    layer.append(neighbor)
 
-    return units, frozenset(caverns)
+        frontier = layer
 
+    return None
 
-def move_unit(location, units, caverns):
-    """Move a unit."""
-    unit = units[location]
 
-    in_range = set.union(
-        *(
-            set(get_neighbors(k)) & caverns
-            for k, v in units.items()
-            if v.race != unit.race
+def get_attacks(low, high, workers):
+    """Get elf attacks to try next, doubling until one loses no elf."""
+    if high is None:
+        return sorted(
+            {min(low * 2 ** (i + 1), POINTS) for i in range(workers)}
         )
-    )
-
-    paths = defaultdict(list)
-    free = frozenset(caverns - set(units.keys()))
-
-    for end in in_range & free:
-        path = get_path(location, end, free)
-
-        if path:
-            paths[len(path)].append(path)
-
-    if paths:
-        del units[location]
-        location = min(
-            sorted(paths.items())[0][1],
-            key=lambda path: (path[0].real, path[0].imag),
-        )[0]
-        units[location] = unit
-
-    return location, units
 
+    return sorted(
+        {low + (high - low) * (i + 1) // (workers + 1) for i in range(workers)}
+        - {low, high}
+    )
 
-def play_turn(units, caverns):
-    """Play battle turn."""
-    for location in sorted(
-        units, key=lambda location: (location.real, location.imag)
-    ):
-
-        if len(set(unit.race for unit in units.values())) < 2:
-            return units, True
-
-        if location in units:
-            units = play_unit_turn(location, units, caverns)
-
-    return units, False
 
+def get_enemies(unit, cells, width):
+    """Get neighboring enemies in reading order."""
+    return [
+        cells[unit.position + offset]
+        for offset in (-width, -1, 1, width)
+        if isinstance(cells[unit.position + offset], Unit)
+        and cells[unit.position + offset].race != unit.race
+    ]
 
-def play_unit_turn(location, units, caverns):
-    """Play a single unit turn."""
-    if not get_enemies(location, units):
-        location, units = move_unit(location, units, caverns)
 
-    units = attack(location, units)
+@cache
+def load_map(puzzle_input):
+    """Load units, flat grid of caverns and grid width from input."""
+    width = max(len(line) for line in puzzle_input)
+    units = []
+    template = []
 
-    return units
+    for i, line in enumerate(puzzle_input):
+        for j, char in enumerate(line.ljust(width, WALL)):
+            if char in ENEMIES:
+                units.append((char, i * width + j))
+
+            template.append(WALL if char == WALL else None)
+
+    return tuple(units), tuple(template), width
+
+
+def move_unit(unit, units, cells, width):
+    """Move a unit one step towards the nearest square in range."""
+    targets = {
+        enemy.position + offset
+        for enemy in units
+        if enemy.race != unit.race and enemy.points > 0
+        for offset in (-width, -1, 1, width)
+        if cells[enemy.position + offset] is None
+    }
+    step = find_step(unit.position, targets, cells, width)
+
+    if step is not None:
+        cells[unit.position] = None
+        unit.position = step
+        cells[step] = unit
+
+
+def play_round(units, cells, width, counts, elves=0):
+    """Play a battle round, stopping early if it ends or an elf dies."""
+    for unit in sorted(units, key=operator.attrgetter("position")):
+        if unit.points <= 0:
+            continue
+
+        if not counts[ENEMIES[unit.race]] or counts["E"] < elves:
+            return False
+
+        if not get_enemies(unit, cells, width):
+            move_unit(unit, units, cells, width)
+
+        attack(unit, cells, width, counts)
+
+    return counts["E"] >= elves
+
+
+def search_elf_attack(cave, jobs=1):
+    """Find the outcome of the weakest elf attack that loses no elf."""
+    workers = jobs or os.cpu_count()
+    fight = functools.partial(fight_battle, cave, elves_must_survive=True)
+    outcomes = {}
+    low, high = 3, None
+
+    with contextlib.ExitStack() as stack:
+        if workers > 1:
+            executor = ProcessPoolExecutor(workers)
+            stack.push(functools.partial(shut_down, executor))
+            fight_all = executor.map
+        else:
+            fight_all = map
+
+        while high is None or high - low > 1:
+            if low >= POINTS:
+                raise ValueError("elves lose one even when killing in one hit")
+
+            attacks = get_attacks(low, high, workers)
+            outcomes |= zip(attacks, fight_all(fight, attacks))
+            high = min(
+                (attack for attack, outcome in outcomes.items() if outcome),
+                default=None,
+            )
+            low = max(
+                [low]
+                + [
+                    attack
+                    for attack, outcome in outcomes.items()
+                    if not outcome and (high is None or attack < high)
+                ]
+            )
+
+    return outcomes[high]
+
+
+def shut_down(executor, exc_type, exc, traceback):
+    """Shut down a pool, cancelling its battles if an error escaped."""
+    del exc, traceback
+    executor.shutdown(wait=exc_type is None, cancel_futures=True)
 
 
 if __name__ == "__main__":
@@ -4,232 +4,159 @@ __author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
 __date__ = "2025"
 __license__ = "MIT"
 
-from dataclasses import dataclass
-
-OPCODES = [
-    "addr",
-    "addi",
-    "mulr",
-    "muli",
-    "banr",
-    "bani",
-    "borr",
-    "bori",
-    "setr",
-    "seti",
-    "gtir",
-    "gtri",
-    "gtrr",
-    "eqir",
-    "eqri",
-    "eqrr",
-]
-
-
-@dataclass
-class Sample:
-    """Sample of opcode application."""
-
-    before: tuple[int]
-    opcode: int
-    a: int
-    b: int
-    c: int
-    after: tuple[int]
+from functools import partial
+
+import device
+
+ALL_OPCODES = (1 << len(device.OPCODES)) - 1
+CHUNK_SIZE = 1 << 16
+PATH = "data/day_16.txt"
 
 
 def main():
     """Solve day 16 puzzles."""
-    with open("data/day_16.txt", encoding="ascii") as input_file:
-        puzzle_input = tuple(line.rstrip() for line in input_file.readlines())
-
-    print(star_1(puzzle_input))
-    print(star_2(puzzle_input))
+    for star in (star_1, star_2):
+        with open(PATH, encoding="ascii") as input_file:
+            print(star(read_lines(input_file)))
 
 
 def star_1(puzzle_input):
     """Solve first puzzle."""
-    samples, _ = load_samples_test(puzzle_input)
+    samples = read_samples(iter(puzzle_input))
 
-    return sum(
-        sum(
-            sample.after
-            == execute(opcode, sample.a, sample.b, sample.c, sample.before)
-            for opcode in OPCODES
-        )
-        >= 3
-        for sample in samples
-    )
+    return sum(get_mask(sample).bit_count() >= 3 for sample in samples)
 
 
 def star_2(puzzle_input):
     """Solve second puzzle."""
-    samples, test = load_samples_test(puzzle_input)
+    lines = iter(puzzle_input)
+    opcodes = solve_opcodes(get_compatibility(read_samples(lines)))
 
-    candidates = {i: set(OPCODES) for i in range(len(OPCODES))}
-    opcodes = {}
-
-    while candidates:
-        sample = samples.pop()
-
-        if sample.opcode in opcodes:
-            continue
+    registers = 4 * [0]
 
-        incompatible = {
-            opcode
-            for opcode in candidates[sample.opcode]
-            if sample.after
-            != execute(opcode, sample.a, sample.b, sample.c, sample.before)
-        }
+    for opcode, a, b, c in read_program(lines):
+        device.execute(device.decode(opcodes[opcode], a, b, c), registers)
 
-        candidates[sample.opcode] -= incompatible
+    return registers[0]
 
-        while any(len(candidate) == 1 for candidate in candidates.values()):
-            opcodes, candidates = simplify(opcodes, candidates)
 
-    registers = 4 * [0]
+def augment(number, compatible, owners, seen):
+    """Find an augmenting path assigning an opcode to a number."""
+    for opcode in range(len(device.OPCODES)):
+        if compatible[number] >> opcode & 1 and opcode not in seen:
+            seen.add(opcode)
 
-    for opcode, a, b, c in test:
-        registers = execute(opcodes[opcode], a, b, c, registers)
+            if opcode not in owners or augment(
+                owners[opcode], compatible, owners, seen
+            ):
+                owners[opcode] = number
 
-    return registers[0]
+                return True
 
+    return False
 
-def execute(opcode, a, b, c, registers):
-    """Execute an instruction."""
-    registers = list(registers)
 
-    match opcode[:2]:
-        case "ad":
-            registers = execute_add(opcode, a, b, c, registers)
-        case "mu":
-            registers = execute_mul(opcode, a, b, c, registers)
-        case "ba":
-            registers = execute_ban(opcode, a, b, c, registers)
-        case "bo":
-            registers = execute_bor(opcode, a, b, c, registers)
-        case "se":
-            registers = execute_set(opcode, a, c, registers)
-        case "gt":
-            registers = execute_gt(opcode, a, b, c, registers)
-        case "eq":
-            registers = execute_eq(opcode, a, b, c, registers)
+def get_compatibility(samples):
+    """Get the bitmask of opcodes compatible with each opcode number."""
+    compatible = len(device.OPCODES) * [ALL_OPCODES]
 
-    return tuple(registers)
+    for sample in samples:
+        compatible[sample[1]] = get_mask(sample, compatible[sample[1]])
 
+    return compatible
 
-def execute_add(opcode, a, b, c, registers):
-    """Execute an addition."""
-    match opcode:
-        case "addr":
-            registers[c] = registers[a] + registers[b]
-        case "addi":
-            registers[c] = registers[a] + b
 
-    return registers
+def get_mask(sample, candidates=ALL_OPCODES):
+    """Get the bitmask of candidate opcodes a sample is consistent with."""
+    before, _, a, b, c, after = sample
 
+    if before[:c] != after[:c] or before[c + 1 :] != after[c + 1 :]:
+        return 0
 
-def execute_ban(opcode, a, b, c, registers):
-    """Execute a bitwise AND."""
-    match opcode:
-        case "banr":
-            registers[c] = registers[a] & registers[b]
-        case "bani":
-            registers[c] = registers[a] & b
+    return sum(
+        1 << opcode
+        for opcode, operation in enumerate(device.OPERATIONS)
+        if candidates >> opcode & 1 and operation(a, b)(before) == after[c]
+    )
 
-    return registers
 
+def match_opcodes(compatible):
+    """Match opcode numbers to opcodes by augmenting paths."""
+    owners = {}
 
-def execute_bor(opcode, a, b, c, registers):
-    """Execute a bitwise OR."""
-    match opcode:
-        case "borr":
-            registers[c] = registers[a] | registers[b]
-        case "bori":
-            registers[c] = registers[a] | b
+    for number in range(len(compatible)):
+        if not augment(number, compatible, owners, set()):
+            raise ValueError(f"no opcode fits number {number}")
 
-    return registers
+    return {number: opcode for opcode, number in owners.items()}
 
 
-def execute_eq(opcode, a, b, c, registers):
-    """Execute an equality testing."""
-    match opcode:
-        case "eqir":
-            registers[c] = int(a == registers[b])
-        case "eqri":
-            registers[c] = int(registers[a] == b)
-        case "eqrr":
-            registers[c] = int(registers[a] == registers[b])
+def parse_registers(line):
+    """Parse the registers of a Before or After line."""
+    return tuple(map(int, line[9:-1].split(",")))
 
-    return registers
 
+def read_lines(input_file, chunk_size=CHUNK_SIZE):
+    """Lazily yield the right-stripped lines of a file read in chunks."""
+    rest = ""
 
-def execute_gt(opcode, a, b, c, registers):
-    """Execute a greater-than testing."""
-    match opcode:
-        case "gtir":
-            registers[c] = int(a > registers[b])
-        case "gtri":
-            registers[c] = int(registers[a] > b)
-        case "gtrr":
-            registers[c] = int(registers[a] > registers[b])
+    for chunk in iter(partial(input_file.read, chunk_size), ""):
+        lines = (rest + chunk).split("\n")
+        rest = lines.pop()
 
-    return registers
+        for line in lines:
+            yield line.rstrip()
 
+    if rest:
+        yield rest.rstrip()
 
-def execute_mul(opcode, a, b, c, registers):
-    """Execute a multiplication."""
-    match opcode:
-        case "mulr":
-            registers[c] = registers[a] * registers[b]
-        case "muli":
-            registers[c] = registers[a] * b
 
-    return registers
+def read_program(lines):
+    """Lazily yield the instructions of the test program."""
+    for line in lines:
+        if line:
+            yield tuple(map(int, line.split()))
 
 
-def execute_set(opcode, a, c, registers):
-    """Execute an assignment."""
-    match opcode:
-        case "setr":
-            registers[c] = registers[a]
-        case "seti":
-            registers[c] = a
+def read_samples(lines):
+    """Lazily yield samples from lines, stopping after the last one."""
+    for line in lines:
+        if not line.startswith("Before"):
+            return
 
-    return registers
+        opcode, a, b, c = map(int, next(lines, "").split())
+        after = parse_registers(next(lines, ""))
+        next(lines, "")
 
+        yield parse_registers(line), opcode, a, b, c, after
 
-def load_samples_test(puzzle_input):
-    """Load samples and test from input."""
-    samples = []
-    i = 0
 
-    while "Before" in puzzle_input[i]:
-        before = tuple(map(int, puzzle_input[i][9:-1].split(",")))
-        opcode, a, b, c = map(int, puzzle_input[i + 1].split())
-        after = tuple(map(int, puzzle_input[i + 2][9:-1].split(",")))
-        samples.append(Sample(before, opcode, a, b, c, after))
-        i += 4
+def solve_opcodes(compatible):
+    """Map opcode numbers to opcodes by unit propagation or matching."""
+    compatible = list(compatible)
+    opcodes = {}
+    units = [n for n, mask in enumerate(compatible) if mask.bit_count() == 1]
 
-    test = [tuple(map(int, line.split())) for line in puzzle_input[i + 2 :]]
+    while units:
+        number = units.pop()
 
-    return samples, test
+        if number in opcodes or compatible[number].bit_count() != 1:
+            continue
 
+        mask = compatible[number]
+        opcodes[number] = mask.bit_length() - 1
 
-def simplify(opcodes, candidates):
-    """Simplify candidates."""
-    for k, v in candidates.items():
-        if len(v) == 1:
-            value = tuple(v)[0]
-            opcodes[k] = value
-            del candidates[k]
+        for other, other_mask in enumerate(compatible):
+            if other != number and other_mask & mask:
+                compatible[other] = other_mask & ~mask
 
-            for kk in candidates:
-                candidates[kk] -= v
+                if compatible[other].bit_count() == 1:
+                    units.append(other)
 
-            break
+    if len(opcodes) < len(compatible):
+        return match_opcodes(compatible)
 
-    return opcodes, candidates
+    return opcodes
 
 
 if __name__ == "__main__":
@@ -7,11 +7,12 @@ __license__ = "MIT"
 from collections import deque
 from functools import cache
 
+import inputs
+
 
 def main():
     """Solve day 17 puzzles."""
-    with open("data/day_17.txt", encoding="ascii") as input_file:
-        puzzle_input = tuple(line.rstrip() for line in input_file.readlines())
+    puzzle_input = inputs.load(17)
 
     print(star_1(puzzle_input))
     print(star_2(puzzle_input))
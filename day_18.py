@@ -7,11 +7,12 @@ __license__ = "MIT"
 import itertools
 from functools import cache
 
+import inputs
+
 
 def main():
     """Solve day 18 puzzles."""
-    with open("data/day_18.txt", encoding="ascii") as input_file:
-        puzzle_input = tuple(line.rstrip() for line in input_file.readlines())
+    puzzle_input = inputs.load(18)
 
     print(star_1(puzzle_input))
     print(star_2(puzzle_input))
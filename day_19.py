@@ -4,11 +4,45 @@ __author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
 __date__ = "2025"
 __license__ = "MIT"
 
+import math
+
+import device
+import inputs
+
+DIVISOR_SUM = """
+seti 1 _ i
+seti 1 _ j
+mulr i j t
+eqrr t n t
+addr t ip ip
+addi ip 1 ip
+addr i sum sum
+addi j 1 j
+gtrr j n t
+addr ip t ip
+seti @2 _ ip
+addi i 1 i
+gtrr i n t
+addr t ip ip
+seti @1 _ ip
+"""
+MULTIPLE_TEST = """
+seti 1 _ j
+mulr i j t
+eqrr t n t
+addr t ip ip
+addi ip 1 ip
+addr i sum sum
+addi j 1 j
+gtrr j n t
+addr ip t ip
+seti @1 _ ip
+"""
+
 
 def main():
     """Solve day 19 puzzles."""
-    with open("data/day_19.txt", encoding="ascii") as input_file:
-        puzzle_input = tuple(line.rstrip() for line in input_file.readlines())
+    puzzle_input = inputs.load(19)
 
     print(star_1(puzzle_input))
     print(star_2(puzzle_input))
@@ -16,7 +50,7 @@ def main():
 
 def star_1(puzzle_input):
     """Solve first puzzle."""
-    ip, instructions = load_program(puzzle_input)
+    ip, instructions = device.load_program(puzzle_input)
     registers = execute_instructions(instructions, 6 * [0], ip)
 
     return registers[0]
@@ -24,153 +58,71 @@ def star_1(puzzle_input):
 
 def star_2(puzzle_input):
     """Solve second puzzle."""
-    ip, instructions = load_program(puzzle_input)
+    ip, instructions = device.load_program(puzzle_input)
     registers = execute_instructions(instructions, [1] + 5 * [0], ip)
 
     return registers[0]
 
 
-def execute(instruction, registers):
-    """Execute an instruction."""
-    opcode, a, b, c = instruction
-
-    match opcode[:2]:
-        case "ad":
-            registers = execute_add(opcode, a, b, c, registers)
-        case "mu":
-            registers = execute_mul(opcode, a, b, c, registers)
-        case "ba":
-            registers = execute_ban(opcode, a, b, c, registers)
-        case "bo":
-            registers = execute_bor(opcode, a, b, c, registers)
-        case "se":
-            registers = execute_set(opcode, a, c, registers)
-        case "gt":
-            registers = execute_gt(opcode, a, b, c, registers)
-        case "eq":
-            registers = execute_eq(opcode, a, b, c, registers)
-
-    return registers
-
-
-def execute_add(opcode, a, b, c, registers):
-    """Execute an addition."""
-    match opcode:
-        case "addr":
-            registers[c] = registers[a] + registers[b]
-        case "addi":
-            registers[c] = registers[a] + b
-
-    return registers
-
-
-def execute_ban(opcode, a, b, c, registers):
-    """Execute a bitwise AND."""
-    match opcode:
-        case "banr":
-            registers[c] = registers[a] & registers[b]
-        case "bani":
-            registers[c] = registers[a] & b
-
-    return registers
-
-
-def execute_bor(opcode, a, b, c, registers):
-    """Execute a bitwise OR."""
-    match opcode:
-        case "borr":
-            registers[c] = registers[a] | registers[b]
-        case "bori":
-            registers[c] = registers[a] | b
-
-    return registers
-
-
-def execute_eq(opcode, a, b, c, registers):
-    """Execute an equality testing."""
-    match opcode:
-        case "eqir":
-            registers[c] = int(a == registers[b])
-        case "eqri":
-            registers[c] = int(registers[a] == b)
-        case "eqrr":
-            registers[c] = int(registers[a] == registers[b])
-
-    return registers
-
-
-def execute_gt(opcode, a, b, c, registers):
-    """Execute a greater-than testing."""
-    match opcode:
-        case "gtir":
-            registers[c] = int(a > registers[b])
-        case "gtri":
-            registers[c] = int(registers[a] > b)
-        case "gtrr":
-            registers[c] = int(registers[a] > registers[b])
-
-    return registers
-
-
 def execute_instructions(instructions, registers, ip):
     """Execute list of instructions."""
-    while 0 <= registers[ip] < len(instructions):
-        if registers[ip] == 2:
-            registers = execute_loop(instructions[2:12], registers)
-        else:
-            registers = execute(instructions[registers[ip]], registers)
+    idioms = device.find_idioms(
+        instructions,
+        ip,
+        ((DIVISOR_SUM, run_divisor_sum), (MULTIPLE_TEST, run_multiple_test)),
+    )
 
-        registers[ip] += 1
+    for _ in device.run_compiled(instructions, registers, ip, idioms):
+        pass
 
     return registers
 
 
-def execute_loop(instructions, registers):
-    """Execute special loop."""
-    while registers[instructions[1][1]] <= registers[instructions[2][2]]:
-        if registers[instructions[2][2]] % registers[instructions[1][1]] == 0:
-            registers[instructions[5][2]] += registers[instructions[1][1]]
+def run_divisor_sum(bindings, end, registers):
+    """Add up the divisors of n as the nested loop would, if it can."""
+    n = registers[bindings["n"]]
 
-        registers[instructions[1][1]] += 1
+    if n < 1:
+        return False
 
-    registers[instructions[4][1]] = 11
+    registers[bindings["sum"]] += sum_divisors(n)
+    registers[bindings["i"]] = registers[bindings["j"]] = n + 1
+    registers[bindings["t"]] = 1
+    registers[bindings["ip"]] = end
 
-    return registers
+    return True
 
 
-def execute_mul(opcode, a, b, c, registers):
-    """Execute a multiplication."""
-    match opcode:
-        case "mulr":
-            registers[c] = registers[a] * registers[b]
-        case "muli":
-            registers[c] = registers[a] * b
+def run_multiple_test(bindings, end, registers):
+    """Add i if it divides n as the inner loop would, if it can."""
+    i = registers[bindings["i"]]
+    n = registers[bindings["n"]]
 
-    return registers
+    if i < 1 or n < 1:
+        return False
 
+    if n % i == 0:
+        registers[bindings["sum"]] += i
 
-def execute_set(opcode, a, c, registers):
-    """Execute an assignment."""
-    match opcode:
-        case "setr":
-            registers[c] = registers[a]
-        case "seti":
-            registers[c] = a
+    registers[bindings["j"]] = n + 1
+    registers[bindings["t"]] = 1
+    registers[bindings["ip"]] = end
+
+    return True
 
-    return registers
 
+def sum_divisors(n):
+    """Sum the divisors of a positive number."""
+    total = 0
 
-def load_program(puzzle_input):
-    """Load program from input."""
-    ip = int(puzzle_input[0][-1])
-    instructions = []
+    for divisor in range(1, math.isqrt(n) + 1):
+        if n % divisor == 0:
+            total += divisor
 
-    for line in puzzle_input[1:]:
-        opcode, a, b, c = line.split()
-        a, b, c = map(int, (a, b, c))
-        instructions.append((opcode, a, b, c))
+            if divisor * divisor != n:
+                total += n // divisor
 
-    return ip, tuple(instructions)
+    return total
 
 
 if __name__ == "__main__":
@@ -7,11 +7,12 @@ __license__ = "MIT"
 import itertools
 from collections import Counter
 
+import inputs
+
 
 def main():
     """Solve day 2 puzzles."""
-    with open("data/day_2.txt", encoding="ascii") as input_file:
-        puzzle_input = tuple(line.rstrip() for line in input_file.readlines())
+    puzzle_input = inputs.load(2)
 
     print(star_1(puzzle_input))
     print(star_2(puzzle_input))
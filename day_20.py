@@ -6,13 +6,14 @@ __license__ = "MIT"
 
 from collections import defaultdict, deque
 
+import inputs
+
 DIRECTIONS = {"N": 1j, "S": -1j, "E": 1, "W": -1}
 
 
 def main():
     """Solve day 20 puzzles."""
-    with open("data/day_20.txt", encoding="ascii") as input_file:
-        puzzle_input = input_file.read().rstrip()
+    puzzle_input = inputs.load(20)
 
     print(star_1(puzzle_input))
     print(star_2(puzzle_input))
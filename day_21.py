@@ -4,11 +4,25 @@ __author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
 __date__ = "2025"
 __license__ = "MIT"
 
+import device
+import inputs
+
+DIVISION = """
+seti 0 _ q
+addi q 1 t
+muli t $d t
+gtrr t n t
+addr t ip ip
+addi ip 1 ip
+seti @9 _ ip
+addi q 1 q
+seti @1 _ ip
+"""
+
 
 def main():
     """Solve day 21 puzzles."""
-    with open("data/day_21.txt", encoding="ascii") as input_file:
-        puzzle_input = tuple(line.rstrip() for line in input_file.readlines())
+    puzzle_input = inputs.load(21)
 
     print(star_1(puzzle_input))
     print(star_2(puzzle_input))
@@ -16,52 +30,58 @@ def main():
 
 def star_1(puzzle_input):
     """Solve first puzzle."""
-    instructions = load_program(puzzle_input)
-    values = get_values(instructions)
+    ip, instructions = device.load_program(puzzle_input)
 
-    return values[0]
+    return next(get_values(instructions, ip))
 
 
 def star_2(puzzle_input):
     """Solve second puzzle."""
-    instructions = load_program(puzzle_input)
-    values = get_values(instructions)
+    ip, instructions = device.load_program(puzzle_input)
+
+    return list(get_values(instructions, ip))[-1]
+
 
-    return values[-1]
+def get_values(instructions, ip):
+    """Lazily yield halting values of register 0 until they repeat."""
+    checks = [
+        (i, a + b)
+        for i, (opcode, a, b, _) in enumerate(instructions)
+        if device.OPCODES[opcode] == "eqrr" and 0 in (a, b)
+    ]
 
+    if not checks:
+        return
 
-def get_values(instructions):
-    """Get halting values."""
-    values = []
-    a = instructions[5][1]
+    check, register = checks[0]
+    idioms = device.find_idioms(instructions, ip, ((DIVISION, run_division),))
+    registers = 6 * [0]
+    values = set()
 
-    while True:
-        b = a | instructions[6][2]
-        a = instructions[7][1]
+    for _ in device.run_compiled(
+        instructions, registers, ip, idioms, frozenset((check,))
+    ):
+        if registers[register] in values:
+            return
 
-        while b > 0:
-            a = (
-                ((a + (b & instructions[8][2])) & instructions[10][2])
-                * instructions[11][2]
-            ) & instructions[12][2]
-            b //= instructions[8][2] + 1
+        values.add(registers[register])
 
-        if a in values:
-            return values
+        yield registers[register]
 
-        values.append(a)
 
+def run_division(bindings, end, registers):
+    """Divide n by the divisor as the counting loop would, if it can."""
+    divisor = bindings["$d"]
+    n = registers[bindings["n"]]
 
-def load_program(puzzle_input):
-    """Load program from input."""
-    instructions = []
+    if divisor < 1 or n < 0:
+        return False
 
-    for line in puzzle_input[1:]:
-        opcode, a, b, c = line.split()
-        a, b, c = map(int, (a, b, c))
-        instructions.append((opcode, a, b, c))
+    registers[bindings["q"]] = n // divisor
+    registers[bindings["t"]] = 1
+    registers[bindings["ip"]] = end
 
-    return tuple(instructions)
+    return True
 
 
 if __name__ == "__main__":
@@ -8,6 +8,8 @@ import bisect
 import itertools
 from functools import cache
 
+import inputs
+
 MODULO = 20183
 TOOLS = {
     0: {"climbing_gear", "torch"},
@@ -18,8 +20,7 @@ TOOLS = {
 
 def main():
     """Solve day 22 puzzles."""
-    with open("data/day_22.txt", encoding="ascii") as input_file:
-        puzzle_input = tuple(line.rstrip() for line in input_file.readlines())
+    puzzle_input = inputs.load(22)
 
     print(star_1(puzzle_input))
     print(star_2(puzzle_input))
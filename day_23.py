@@ -8,6 +8,8 @@ from dataclasses import dataclass
 
 from z3 import If, Int, Optimize, Sum
 
+import inputs
+
 
 @dataclass
 class Nanobot:
@@ -21,8 +23,7 @@ class Nanobot:
 
 def main():
     """Solve day 23 puzzles."""
-    with open("data/day_23.txt", encoding="ascii") as input_file:
-        puzzle_input = tuple(line.rstrip() for line in input_file.readlines())
+    puzzle_input = inputs.load(23)
 
     print(star_1(puzzle_input))
     print(star_2(puzzle_input))
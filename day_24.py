@@ -7,6 +7,8 @@ __license__ = "MIT"
 import re
 from dataclasses import dataclass
 
+import inputs
+
 ENEMIES = {"immune_system": "infection", "infection": "immune_system"}
 
 
@@ -38,8 +40,7 @@ class Group:
 
 def main():
     """Solve day 24 puzzles."""
-    with open("data/day_24.txt", encoding="ascii") as input_file:
-        puzzle_input = tuple(line.rstrip() for line in input_file.readlines())
+    puzzle_input = inputs.load(24)
 
     print(star_1(puzzle_input))
     print(star_2(puzzle_input))
@@ -7,6 +7,8 @@ __license__ = "MIT"
 
 from dataclasses import dataclass
 
+import inputs
+
 
 @dataclass(frozen=True)
 class Point:
@@ -20,8 +22,7 @@ class Point:
 
 def main():
     """Solve day 25 puzzles."""
-    with open("data/day_25.txt", encoding="ascii") as input_file:
-        puzzle_input = tuple(line.rstrip() for line in input_file.readlines())
+    puzzle_input = inputs.load(25)
 
     print(star_1(puzzle_input))
 
@@ -4,14 +4,87 @@ __author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
 __date__ = "2025"
 __license__ = "MIT"
 
+import bisect
 import itertools
+from dataclasses import dataclass
 from functools import cache
 
+import inputs
+
+MAX_COVERAGE_AREA = 10**7
+
+
+@dataclass
+class CoverageTree:
+    """Segment tree of claim coverage over compressed coordinates."""
+
+    coordinates: tuple[int]
+    counts: list[int]
+    once: list[int]
+    twice: list[int]
+
+    def update(self, start, end, delta):
+        """Add delta to the coverage between the start and end indices."""
+
+        def visit(node, low, high):
+            if end <= low or high <= start:
+                return
+
+            if start <= low and high <= end:
+                self.counts[node] += delta
+            else:
+                middle = (low + high) // 2
+                visit(2 * node, low, middle)
+                visit(2 * node + 1, middle, high)
+
+            length = self.coordinates[high] - self.coordinates[low]
+            leaf = high - low == 1
+
+            if self.counts[node] >= 2:
+                self.twice[node] = length
+            elif self.counts[node] == 1:
+                self.twice[node] = (
+                    0 if leaf else sum(self.once[2 * node : 2 * node + 2])
+                )
+            else:
+                self.twice[node] = (
+                    0 if leaf else sum(self.twice[2 * node : 2 * node + 2])
+                )
+
+            if self.counts[node] >= 1:
+                self.once[node] = length
+            else:
+                self.once[node] = (
+                    0 if leaf else sum(self.once[2 * node : 2 * node + 2])
+                )
+
+        visit(1, 0, len(self.coordinates) - 1)
+
+
+@dataclass
+class SpanCounter:
+    """Fenwick trees counting spans by start and by end index."""
+
+    starts: list[int]
+    ends: list[int]
+
+    def add(self, start, end, delta):
+        """Add delta to the count of spans between two indices."""
+        for tree, i in ((self.starts, start), (self.ends, end)):
+            i += 1
+
+            while i < len(tree):
+                tree[i] += delta
+                i += i & -i
+
+    def count_overlaps(self, start, end):
+        """Count the spans overlapping the one between two indices."""
+        return sum_prefix(self.starts, end) - sum_prefix(self.ends, start + 1)
+
 
 def main():
     """Solve day 3 puzzles."""
-    with open("data/day_3.txt", encoding="ascii") as input_file:
-        puzzle_input = tuple(line.rstrip() for line in input_file.readlines())
+    puzzle_input = inputs.load(3)
 
     print(star_1(puzzle_input))
     print(star_2(puzzle_input))
@@ -19,35 +92,129 @@ def main():
 
 def star_1(puzzle_input):
     """Solve first puzzle."""
-    common = compute_common(puzzle_input)
+    if is_large(puzzle_input):
+        return sweep_area(puzzle_input)
 
-    return len(common)
+    coverage, _ = compute_coverage(puzzle_input)
+
+    return len(coverage) - coverage.count(0) - coverage.count(1)
 
 
 def star_2(puzzle_input):
     """Solve second puzzle."""
-    common = compute_common(puzzle_input)
+    if is_large(puzzle_input):
+        return next(iter(find_isolated(puzzle_input)), 0)
+
+    coverage, width = compute_coverage(puzzle_input)
 
-    for claim, squares in load_claims(puzzle_input).items():
-        if not squares & common:
+    for claim, (x, y, w, h) in load_claims(puzzle_input).items():
+        if all(
+            max(coverage[j * width + x : j * width + x + w]) == 1
+            for j in range(y, y + h)
+        ):
             return claim
 
     return 0
 
 
+def build_tree(claims):
+    """Build an empty coverage tree over the claim vertical edges."""
+    coordinates = get_coordinates(claims)
+
+    return CoverageTree(
+        coordinates, *([0] * 4 * len(coordinates) for _ in range(3))
+    )
+
+
 @cache
-def compute_common(puzzle_input):
-    """Compute common squares."""
-    squares = load_claims(puzzle_input).values()
-
-    return set.union(
-        *(
-            squares_0 & squares_1
-            for squares_0, squares_1 in itertools.combinations(squares, 2)
+def compute_coverage(puzzle_input):
+    """Compute how many claims cover each square, row by row."""
+    claims = load_claims(puzzle_input).values()
+    width = max(x + w for x, _, w, _ in claims) + 1
+    height = max(y + h for _, y, _, h in claims)
+    differences = [0] * (width * height)
+
+    for x, y, w, h in claims:
+        for j in range(y, y + h):
+            differences[j * width + x] += 1
+            differences[j * width + x + w] -= 1
+
+    return list(itertools.accumulate(differences)), width
+
+
+@cache
+def find_isolated(puzzle_input):
+    """Sweep claim edges left to right, finding claims overlapping none."""
+    claims = load_claims(puzzle_input)
+    indices = {y: i for i, y in enumerate(get_coordinates(claims))}
+    spans = {
+        claim: (indices[y], indices[y + h])
+        for claim, (_, y, _, h) in claims.items()
+    }
+    counter = SpanCounter(*([0] * (len(indices) + 1) for _ in range(2)))
+    alone = []
+    overlapping = set()
+
+    for _, delta, claim in get_events(claims):
+        start, end = spans[claim]
+
+        if delta < 0:
+            if claim in overlapping:
+                counter.add(start, end, -1)
+            else:
+                del alone[bisect.bisect_left(alone, (start, end, claim))]
+
+            continue
+
+        i = bisect.bisect_right(alone, start, key=lambda span: span[1])
+        j = bisect.bisect_left(alone, end, key=lambda span: span[0])
+
+        for *span, other in alone[i:j]:
+            overlapping.add(other)
+            counter.add(*span, 1)
+
+        del alone[i:j]
+
+        if i < j or counter.count_overlaps(start, end):
+            overlapping.add(claim)
+            counter.add(start, end, 1)
+        else:
+            bisect.insort(alone, (start, end, claim))
+
+    return tuple(claim for claim in claims if claim not in overlapping)
+
+
+def get_coordinates(claims):
+    """Get the sorted vertical edges of the claims."""
+    return tuple(
+        sorted(
+            {y for _, y, _, _ in claims.values()}
+            | {y + h for _, y, _, h in claims.values()}
         )
     )
 
 
+def get_events(claims):
+    """Get left and right claim edges, right edges first at equal x."""
+    return sorted(
+        event
+        for claim, (x, _, w, _) in claims.items()
+        for event in ((x, 1, claim), (x + w, -1, claim))
+    )
+
+
+def is_large(puzzle_input):
+    """Check if the fabric is too large for a coverage array."""
+    claims = load_claims(puzzle_input).values()
+
+    return (
+        max(x + w for x, _, w, _ in claims)
+        * max(y + h for _, y, _, h in claims)
+        > MAX_COVERAGE_AREA
+    )
+
+
+@cache
 def load_claims(puzzle_input):
     """Load claims from input."""
     claims = {}
@@ -56,13 +223,39 @@ def load_claims(puzzle_input):
         chunks = line.split()
         x, y = map(int, chunks[2][:-1].split(","))
         w, h = map(int, chunks[-1].split("x"))
-        claims[int(chunks[0][1:])] = {
-            i + j * 1j
-            for i, j in itertools.product(range(x, x + w), range(y, y + h))
-        }
+        claims[int(chunks[0][1:])] = (x, y, w, h)
 
     return claims
 
 
+def sweep_area(puzzle_input):
+    """Sweep claim edges left to right, measuring the overlapped area."""
+    claims = load_claims(puzzle_input)
+    tree = build_tree(claims)
+    indices = {coordinate: i for i, coordinate in enumerate(tree.coordinates)}
+    events = get_events(claims)
+    area = 0
+    previous = events[0][0]
+
+    for x, delta, claim in events:
+        area += tree.twice[1] * (x - previous)
+        previous = x
+        _, y, _, h = claims[claim]
+        tree.update(indices[y], indices[y + h], delta)
+
+    return area
+
+
+def sum_prefix(tree, i):
+    """Sum the first i counts of a Fenwick tree."""
+    total = 0
+
+    while i:
+        total += tree[i]
+        i &= i - 1
+
+    return total
+
+
 if __name__ == "__main__":
     main()
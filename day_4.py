@@ -6,12 +6,14 @@ __license__ = "MIT"
 
 from collections import defaultdict
 from datetime import datetime
+from functools import cache
+
+import inputs
 
 
 def main():
     """Solve day 4 puzzles."""
-    with open("data/day_4.txt", encoding="ascii") as input_file:
-        puzzle_input = tuple(line.rstrip() for line in input_file.readlines())
+    puzzle_input = inputs.load(4)
 
     print(star_1(puzzle_input))
     print(star_2(puzzle_input))
@@ -60,6 +62,7 @@ def get_minute(intervals):
     return max(minutes.items(), key=lambda item: item[1])
 
 
+@cache
 def load_guards(puzzle_input):
     """Load guards from input."""
     entries = sort_entries(puzzle_input)
@@ -6,11 +6,12 @@ __license__ = "MIT"
 
 import string
 
+import inputs
+
 
 def main():
     """Solve day 5 puzzles."""
-    with open("data/day_5.txt", encoding="ascii") as input_file:
-        puzzle_input = input_file.read().rstrip()
+    puzzle_input = inputs.load(5)
 
     print(star_1(puzzle_input))
     print(star_2(puzzle_input))
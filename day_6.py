@@ -4,14 +4,16 @@ __author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
 __date__ = "2025"
 __license__ = "MIT"
 
-import itertools
-from collections import defaultdict
+from collections import Counter
+
+import inputs
+
+MAX_TOTAL_DISTANCE = 10000
 
 
 def main():
     """Solve day 6 puzzles."""
-    with open("data/day_6.txt", encoding="ascii") as input_file:
-        puzzle_input = tuple(line.rstrip() for line in input_file)
+    puzzle_input = inputs.load(6)
 
     print(star_1(puzzle_input))
     print(star_2(puzzle_input))
@@ -21,14 +23,12 @@ def star_1(puzzle_input):
     """Solve first puzzle."""
     coordinates = load_coordinates(puzzle_input)
     min_x, max_x, min_y, max_y = get_borders(coordinates)
-    areas = defaultdict(int)
+    areas = Counter()
 
-    for x, y in itertools.product(
-        range(min_x, max_x + 1),
-        range(min_y, max_y + 1),
-    ):
-        index = get_index(x, y, coordinates)
-        areas[index] += 1
+    for y in range(min_y, max_y + 1):
+        areas.update(get_row_owners(y, coordinates, min_x, max_x))
+
+    del areas[None]
 
     for i, coordinate in enumerate(coordinates):
         if coordinate[0] in (min_x, max_x) or coordinate[1] in (min_y, max_y):
@@ -40,16 +40,53 @@ def star_1(puzzle_input):
 def star_2(puzzle_input):
     """Solve second puzzle."""
     coordinates = load_coordinates(puzzle_input)
-    min_x, max_x, min_y, max_y = get_borders(coordinates)
+    x_distances = get_axis_distances(
+        (coordinate[0] for coordinate in coordinates), MAX_TOTAL_DISTANCE
+    )
+    y_distances = get_axis_distances(
+        (coordinate[1] for coordinate in coordinates), MAX_TOTAL_DISTANCE
+    )
 
-    return sum(
-        get_total_distance(x, y, coordinates) < 10000
-        for x, y, in itertools.product(
-            range(min_x, max_x + 1), range(min_y, max_y + 1)
-        )
+    return count_below(
+        sorted(x_distances), sorted(y_distances), MAX_TOTAL_DISTANCE
     )
 
 
+def count_below(x_distances, y_distances, threshold):
+    """Count pairs of sorted axis distances summing below a threshold."""
+    count = 0
+    j = len(y_distances)
+
+    for x_distance in x_distances:
+        while j and x_distance + y_distances[j - 1] >= threshold:
+            j -= 1
+
+        count += j
+
+    return count
+
+
+def get_axis_distances(values, threshold):
+    """Get total distances to values along an axis, as far as threshold."""
+    values = sorted(values)
+    margin = threshold // len(values) + 1
+    position = values[0] - margin
+    total = sum(value - position for value in values)
+    distances = []
+    below = 0
+
+    while position <= values[-1] + margin:
+        distances.append(total)
+
+        while below < len(values) and values[below] <= position:
+            below += 1
+
+        total += 2 * below - len(values)
+        position += 1
+
+    return distances
+
+
 def get_borders(coordinates):
     """Get borders of the map."""
     min_x = min(coordinates, key=lambda coordinate: coordinate[0])[0]
@@ -60,29 +97,36 @@ def get_borders(coordinates):
     return min_x, max_x, min_y, max_y
 
 
-def get_index(x, y, coordinates):
-    """Get index of closest coordinate."""
-    closest = None
-    min_distance = float("inf")
+def get_row_owners(y, coordinates, min_x, max_x):
+    """Get the index of the closest coordinate of each cell in a row."""
+    width = max_x - min_x + 1
+    distances = [float("inf")] * width
+    owners = [None] * width
 
-    for i, coordinate in enumerate(coordinates):
-        distance = abs(coordinate[0] - x) + abs(coordinate[1] - y)
+    for i, (x, coordinate_y) in enumerate(coordinates):
+        distance = abs(coordinate_y - y)
+        j = x - min_x
 
-        if distance == min_distance:
-            closest = None
-        elif distance < min_distance:
-            closest = i
-            min_distance = distance
+        if distance < distances[j]:
+            distances[j] = distance
+            owners[j] = i
+        elif distance == distances[j]:
+            owners[j] = None
 
-    return closest
+    for step, columns in (
+        (1, range(1, width)),
+        (-1, range(width - 2, -1, -1)),
+    ):
+        for j in columns:
+            distance = distances[j - step] + 1
 
+            if distance < distances[j]:
+                distances[j] = distance
+                owners[j] = owners[j - step]
+            elif distance == distances[j] and owners[j] != owners[j - step]:
+                owners[j] = None
 
-def get_total_distance(x, y, coordinates):
-    """Get total distance to all coordinates."""
-    return sum(
-        abs(coordinate[0] - x) + abs(coordinate[1] - y)
-        for coordinate in coordinates
-    )
+    return owners
 
 
 def load_coordinates(puzzle_input):
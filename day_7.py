@@ -6,11 +6,12 @@ __license__ = "MIT"
 
 from collections import defaultdict
 
+import inputs
+
 
 def main():
     """Solve day 7 puzzles."""
-    with open("data/day_7.txt", encoding="ascii") as input_file:
-        puzzle_input = tuple(line.rstrip() for line in input_file)
+    puzzle_input = inputs.load(7)
 
     print(star_1(puzzle_input))
     print(star_2(puzzle_input))
@@ -4,11 +4,12 @@ __author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
 __date__ = "2025"
 __license__ = "MIT"
 
+import inputs
+
 
 def main():
     """Solve day 8 puzzles."""
-    with open("data/day_8.txt", encoding="ascii") as input_file:
-        puzzle_input = input_file.read().rstrip()
+    puzzle_input = inputs.load(8)
 
     print(star_1(puzzle_input))
     print(star_2(puzzle_input))
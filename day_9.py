@@ -4,13 +4,20 @@ __author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
 __date__ = "2025"
 __license__ = "MIT"
 
+import math
+import operator
+from array import array
 from collections import defaultdict, deque
+from itertools import chain
+
+import inputs
+
+WARMUP_ROUNDS = 4
 
 
 def main():
     """Solve day 9 puzzles."""
-    with open("data/day_9.txt", encoding="ascii") as input_file:
-        puzzle_input = input_file.read().rstrip()
+    puzzle_input = inputs.load(9)
 
     print(star_1(puzzle_input))
     print(star_2(puzzle_input))
@@ -20,31 +27,76 @@ def star_1(puzzle_input):
     """Solve first puzzle."""
     players, n_marbles = load_players_marbles(puzzle_input)
 
-    return compute_max_score(players, n_marbles)
+    return compute_max_score_batched(players, n_marbles)
 
 
 def star_2(puzzle_input):
     """Solve second puzzle."""
     players, n_marbles = load_players_marbles(puzzle_input)
 
-    return compute_max_score(players, 100 * n_marbles)
+    return compute_max_score_batched(players, 100 * n_marbles)
 
 
 def compute_max_score(players, n_marbles):
     """Compute maximum score of given configuration."""
     marbles = deque([0])
     scores = defaultdict(int)
+    place_marbles(marbles, scores, players, range(1, n_marbles + 1))
+
+    return max(scores.values())
+
+
+def compute_max_score_batched(players, n_marbles):
+    """Compute maximum score splicing whole batches of rounds of 23."""
+    marbles = deque([0])
+    scores = [0] * players
+    start = min(n_marbles, 23 * WARMUP_ROUNDS)
+    place_marbles(marbles, scores, players, range(1, start + 1))
+
+    circle = list(marbles)
+    carry = circle[:7]
+    del circle[:7]
+
+    base = start
+
+    while base + 23 <= n_marbles:
+        n_rounds = min((n_marbles - base) // 23, len(circle) // 16)
+        score_rounds(scores, circle, base, n_rounds)
+        carry = splice_rounds(circle, carry, base, n_rounds)
+        del circle[: 16 * n_rounds]
+        base += 23 * n_rounds
+
+    return max(scores)
+
+
+def compute_max_score_linked(players, n_marbles):
+    """Compute maximum score keeping the circle in preallocated link arrays."""
+    following = array("I", bytes(4 * (n_marbles + 1)))
+    preceding = array("I", bytes(4 * (n_marbles + 1)))
+    scores = [0] * players
+    current = 0
 
     for i in range(1, n_marbles + 1):
         if i % 23 == 0:
-            marbles.rotate(7)
-            scores[i % players] += i + marbles.popleft()
+            for _ in range(7):
+                current = preceding[current]
+
+            scores[i % players] += i + current
+            left = preceding[current]
+            current = following[current]
+            following[left] = current
+            preceding[current] = left
 
         else:
-            marbles.rotate(-2)
-            marbles.appendleft(i)
+            left = following[current]
+            right = following[left]
+            following[left] = i
+            preceding[i] = left
+            following[i] = right
+            preceding[right] = i
+            current = i
 
-    return max(scores.values())
+    return max(scores)
 
 
 def load_players_marbles(puzzle_input):
@@ -54,5 +106,68 @@ def load_players_marbles(puzzle_input):
     return int(chunks[0]), int(chunks[-2])
 
 
+def place_marbles(marbles, scores, players, numbers):
+    """Place numbered marbles one at a time, the current one leftmost."""
+    for i in numbers:
+        if i % 23 == 0:
+            marbles.rotate(7)
+            scores[i % players] += i + marbles.popleft()
+
+        else:
+            marbles.rotate(-2)
+            marbles.appendleft(i)
+
+
+def score_rounds(scores, circle, base, n_rounds):
+    """Score rounds whose removed marbles lie every 16 marbles in circle."""
+    players = len(scores)
+    period = players // math.gcd(23, players)
+    points = list(
+        map(
+            operator.add,
+            range(base + 23, base + 23 * (n_rounds + 1), 23),
+            circle[12 : 16 * n_rounds : 16],
+        )
+    )
+
+    for i in range(min(period, n_rounds)):
+        scores[(base + 23 * (i + 1)) % players] += sum(points[i::period])
+
+
+def splice_rounds(circle, carry, base, n_rounds):
+    """Append what rounds leave of circle, returning its new first marbles."""
+    last = n_rounds - 1
+    columns = []
+
+    for i in range(19):
+        if i < 7:
+            columns.append(
+                chain(
+                    (carry[i],),
+                    (
+                        circle[13 + i // 2 : 16 * last : 16]
+                        if i % 2
+                        else range(base + 19 + i // 2, base + 23 * last, 23)
+                    ),
+                )
+            )
+        else:
+            columns.append(circle[i - 7 : 16 * n_rounds : 16])
+
+        if i:
+            columns.append(range(base + i, base + i + 23 * n_rounds, 23))
+
+    circle.extend(chain.from_iterable(zip(*columns)))
+
+    return [
+        (
+            circle[16 * last + 13 + i // 2]
+            if i % 2
+            else base + 23 * last + 19 + i // 2
+        )
+        for i in range(7)
+    ]
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,403 @@
+"""Shared register machine of the wrist device"""
+
+__author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
+__date__ = "2025"
+__license__ = "MIT"
+
+import argparse
+import time
+from dataclasses import dataclass, replace
+from functools import cache, partial
+
+import inputs
+
+ADDR = 0
+COMMUTATIVE = frozenset(("addr", "mulr", "banr", "borr", "eqrr"))
+LIMIT = 10**7
+MAX_INLINED = 8
+OPCODES = (
+    "addr",
+    "addi",
+    "mulr",
+    "muli",
+    "banr",
+    "bani",
+    "borr",
+    "bori",
+    "setr",
+    "seti",
+    "gtir",
+    "gtri",
+    "gtrr",
+    "eqir",
+    "eqri",
+    "eqrr",
+)
+OPERATIONS = (
+    lambda a, b: lambda registers: registers[a] + registers[b],
+    lambda a, b: lambda registers: registers[a] + b,
+    lambda a, b: lambda registers: registers[a] * registers[b],
+    lambda a, b: lambda registers: registers[a] * b,
+    lambda a, b: lambda registers: registers[a] & registers[b],
+    lambda a, b: lambda registers: registers[a] & b,
+    lambda a, b: lambda registers: registers[a] | registers[b],
+    lambda a, b: lambda registers: registers[a] | b,
+    lambda a, b: lambda registers: registers[a],
+    lambda a, b: lambda registers: a,
+    lambda a, b: lambda registers: int(a > registers[b]),
+    lambda a, b: lambda registers: int(registers[a] > b),
+    lambda a, b: lambda registers: int(registers[a] > registers[b]),
+    lambda a, b: lambda registers: int(a == registers[b]),
+    lambda a, b: lambda registers: int(registers[a] == b),
+    lambda a, b: lambda registers: int(registers[a] == registers[b]),
+)
+COMPARISONS = frozenset(range(10, 16))
+TEMPLATES = (
+    "{ra} + {rb}",
+    "{ra} + {b}",
+    "{ra} * {rb}",
+    "{ra} * {b}",
+    "{ra} & {rb}",
+    "{ra} & {b}",
+    "{ra} | {rb}",
+    "{ra} | {b}",
+    "{ra}",
+    "{a}",
+    "1 if {a} > {rb} else 0",
+    "1 if {ra} > {b} else 0",
+    "1 if {ra} > {rb} else 0",
+    "1 if {a} == {rb} else 0",
+    "1 if {ra} == {b} else 0",
+    "1 if {ra} == {rb} else 0",
+)
+
+
+@dataclass(frozen=True)
+class Trace:
+    """Instructions already inlined on a path of compiled source."""
+
+    path: tuple
+    flags: frozenset = frozenset()
+    count: int = 0
+    stops: frozenset = frozenset()
+
+
+def main():
+    """Run the program of a day and report instructions per second."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("day", type=int, choices=(19, 21))
+    parser.add_argument("--registers", nargs=6, type=int, default=6 * [0])
+    parser.add_argument("--limit", type=int, default=LIMIT)
+    parser.add_argument(
+        "--jit", action="store_true", help="compile the program to Python"
+    )
+    args = parser.parse_args()
+
+    ip, program = load_program(inputs.load(args.day))
+    registers = args.registers
+    wall_time = time.perf_counter()
+
+    if args.jit:
+        count = compile_program(program, ip, len(registers))(
+            registers, args.limit
+        )
+    else:
+        count = run_program(decode_program(program), registers, ip, args.limit)
+
+    wall_time = time.perf_counter() - wall_time
+
+    print(f"registers {registers}")
+    print(f"{count} instructions in {wall_time:.3f} s")
+    print(f"{count / wall_time:,.0f} instructions per second")
+
+
+def bind_operand(token, value, start, bindings):
+    """Bind a pattern operand to a value, returning None on mismatch."""
+    if token == "_":
+        return bindings
+
+    if token.startswith("@"):
+        return bindings if value == start + int(token[1:]) - 1 else None
+
+    if token.isdigit():
+        return bindings if value == int(token) else None
+
+    if token in bindings:
+        return bindings if bindings[token] == value else None
+
+    if not token.startswith("$") and value in (
+        bound for name, bound in bindings.items() if not name.startswith("$")
+    ):
+        return None
+
+    return bindings | {token: value}
+
+
+@cache
+def compile_program(program, ip, size=6, stops=frozenset()):
+    """Compile a program into a function running its traces as loops.
+
+    The function runs until the pointer leaves the program or reaches one
+    of the stops, after at least one instruction. It checks the limit once
+    per loop iteration, so it may run a few instructions past it.
+    """
+    names = "".join(f"r{i}, " for i in range(size))
+    trace = Trace((), stops=stops)
+    lines = [
+        "def run(registers, limit=float('inf')):",
+        f"    {names}= registers",
+        f"    pointer = r{ip}",
+        "    count = 0",
+        f"    while 0 <= pointer < {len(program)} and count < limit:",
+        *indent(emit_dispatch(program, ip, range(len(program)), trace), 2),
+    ]
+
+    if stops:
+        lines += [f"        if pointer in {set(stops)}:", "            break"]
+
+    lines += [
+        f"    r{ip} = pointer",
+        f"    registers[:] = {names}",
+        "    return count",
+    ]
+    namespace = {}
+    exec("\n".join(lines), namespace)  # pylint: disable=exec-used
+
+    return namespace["run"]
+
+
+def decode(opcode, a, b, c):
+    """Decode an instruction into its operation and output register."""
+    return OPERATIONS[opcode](a, b), c
+
+
+def decode_program(program):
+    """Decode all instructions of a program."""
+    return tuple(decode(*instruction) for instruction in program)
+
+
+def emit_dispatch(program, ip, starts, trace):
+    """Emit the source jumping to the loop starting at the pointer."""
+    if len(starts) == 1:
+        return [
+            "while count < limit:",
+            *indent(
+                emit_trace(program, ip, replace(trace, path=(starts[0],)))
+            ),
+            "else:",
+            f"    pointer = {starts[0]}",
+        ]
+
+    middle = len(starts) // 2
+
+    return [
+        f"if pointer < {starts[middle]}:",
+        *indent(emit_dispatch(program, ip, starts[:middle], trace)),
+        "else:",
+        *indent(emit_dispatch(program, ip, starts[middle:], trace)),
+    ]
+
+
+def emit_exit(trace, pointer):
+    """Emit the source leaving a trace for the instruction at pointer."""
+    return [f"count += {trace.count}", f"pointer = {pointer}", "break"]
+
+
+def emit_expression(program, ip, i):
+    """Emit the expression of an instruction, folding reads of the pointer."""
+    opcode, a, b, _ = program[i]
+
+    return TEMPLATES[opcode].format(
+        a=a,
+        b=b,
+        ra=i if a == ip else f"r{a}",
+        rb=i if b == ip else f"r{b}",
+    )
+
+
+def emit_goto(program, ip, target, trace):
+    """Emit the source continuing a trace at a known instruction."""
+    if target in trace.stops:
+        return emit_exit(trace, target)
+
+    if target == trace.path[0]:
+        return [f"count += {trace.count}", "continue"]
+
+    if (
+        not 0 <= target < len(program)
+        or target in trace.path
+        or len(trace.path) > MAX_INLINED
+    ):
+        return emit_exit(trace, target)
+
+    return emit_trace(program, ip, replace(trace, path=trace.path + (target,)))
+
+
+def emit_jump(program, ip, i, trace):
+    """Emit the source of an instruction writing to the pointer."""
+    opcode, a, b, _ = program[i]
+    template = TEMPLATES[opcode]
+    operands = [a] * ("{ra}" in template) + [b] * ("{rb}" in template)
+
+    if all(operand == ip for operand in operands):
+        target = OPERATIONS[opcode](a, b)([i] * (ip + 1)) + 1
+
+        return emit_goto(program, ip, target, trace)
+
+    if opcode == ADDR and ip in (a, b) and a + b - ip in trace.flags:
+        return [
+            f"if r{a + b - ip}:",
+            *indent(emit_goto(program, ip, i + 2, trace)),
+            "else:",
+            *indent(emit_goto(program, ip, i + 1, trace)),
+        ]
+
+    return [
+        f"count += {trace.count}",
+        f"pointer = ({emit_expression(program, ip, i)}) + 1",
+        "break",
+    ]
+
+
+def emit_trace(program, ip, trace):
+    """Emit the source of a trace inlining jumps to known instructions."""
+    lines = []
+
+    for i in range(trace.path[-1], len(program)):
+        if i != trace.path[-1] and i in trace.stops:
+            return lines + emit_exit(trace, i)
+
+        opcode, _, _, c = program[i]
+        trace = replace(trace, count=trace.count + 1)
+
+        if c == ip:
+            return lines + emit_jump(program, ip, i, trace)
+
+        lines.append(f"r{c} = {emit_expression(program, ip, i)}")
+        flags = trace.flags - {c}
+
+        if opcode in COMPARISONS:
+            flags |= {c}
+
+        trace = replace(trace, flags=flags)
+
+    return lines + emit_exit(trace, len(program))
+
+
+def execute(instruction, registers):
+    """Execute a decoded instruction in place."""
+    operation, c = instruction
+    registers[c] = operation(registers)
+
+
+def find_idioms(program, ip, idioms):
+    """Find loops with a native routine, keyed by their first instruction."""
+    found = {}
+
+    for start in range(len(program)):
+        for pattern, routine in idioms:
+            pattern = parse_pattern(pattern)
+
+            if start in found or start + len(pattern) > len(program):
+                continue
+
+            bindings = match_idiom(pattern, program, start, {"ip": ip})
+
+            if bindings is not None:
+                end = start + len(pattern) - 1
+                found[start] = partial(routine, bindings, end)
+
+    return found
+
+
+def indent(lines, depth=1):
+    """Indent lines of source code."""
+    return ["    " * depth + line for line in lines]
+
+
+def load_program(puzzle_input):
+    """Load instruction pointer register and program with integer opcodes."""
+    ip = int(puzzle_input[0].split()[-1])
+    program = []
+
+    for line in puzzle_input[1:]:
+        opcode, a, b, c = line.split()
+        program.append((OPCODES.index(opcode), *map(int, (a, b, c))))
+
+    return ip, tuple(program)
+
+
+def match_idiom(pattern, program, start, bindings, line=0):
+    """Match a pattern from a line on, returning its register bindings."""
+    if line == len(pattern):
+        return bindings
+
+    opcode, a, b, c = program[start + line]
+    name, *tokens = pattern[line]
+
+    if OPCODES[opcode] != name:
+        return None
+
+    for values in ((a, b, c), (b, a, c))[: 1 + (name in COMMUTATIVE)]:
+        matched = bindings
+
+        for token, value in zip(tokens, values):
+            if matched is not None:
+                matched = bind_operand(token, value, start, matched)
+
+        if matched is not None:
+            matched = match_idiom(pattern, program, start, matched, line + 1)
+
+        if matched is not None:
+            return matched
+
+    return None
+
+
+@cache
+def parse_pattern(pattern):
+    """Parse the lines of a pattern into opcodes and operand tokens."""
+    return tuple(tuple(line.split()) for line in pattern.strip().splitlines())
+
+
+def run_compiled(program, registers, ip, idioms=None, stops=frozenset()):
+    """Run a program compiled and its idioms natively, yielding at stops."""
+    idioms = idioms or {}
+    run = compile_program(
+        program, ip, len(registers), frozenset(stops | idioms.keys())
+    )
+
+    while 0 <= registers[ip] < len(program):
+        if registers[ip] in stops:
+            yield registers[ip]
+
+        idiom = idioms.get(registers[ip])
+
+        if idiom is not None and idiom(registers):
+            registers[ip] += 1
+        else:
+            run(registers)
+
+
+def run_program(program, registers, ip=None, limit=None):
+    """Run a decoded program in place, returning the instructions run."""
+    if ip is None:
+        for operation, c in program:
+            registers[c] = operation(registers)
+
+        return len(program)
+
+    count = 0
+    limit = limit or float("inf")
+
+    while 0 <= registers[ip] < len(program) and count < limit:
+        operation, c = program[registers[ip]]
+        registers[c] = operation(registers)
+        registers[ip] += 1
+        count += 1
+
+    return count
+
+
+if __name__ == "__main__":
+    main()
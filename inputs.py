@@ -0,0 +1,92 @@
+"""Shared loader of memory-mapped puzzle inputs"""
+
+__author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
+__date__ = "2025"
+__license__ = "MIT"
+
+import mmap
+import os
+import re
+from array import array
+from collections.abc import Sequence
+from functools import lru_cache
+
+TEXT_DAYS = frozenset((5, 8, 9, 11, 14, 20))
+INTEGER = re.compile(rb"[-+]?\d+")
+MAX_LOADED = 8
+
+
+class Lines(Sequence):
+    """Lazy view of the right-stripped lines of a buffer."""
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.offsets = array("q", [0])
+        start = buffer.find(b"\n")
+
+        while start != -1:
+            self.offsets.append(start + 1)
+            start = buffer.find(b"\n", start + 1)
+
+        if self.offsets[-1] != len(buffer):
+            self.offsets.append(len(buffer) + 1)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(*index.indices(len(self))))
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("line index out of range")
+
+        return (
+            self.buffer[self.offsets[index] : self.offsets[index + 1] - 1]
+            .decode("ascii")
+            .rstrip()
+        )
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def integers(self):
+        """Lazily yield all integers in the buffer."""
+        return (int(match[0]) for match in INTEGER.finditer(self.buffer))
+
+
+def integers(puzzle_input):
+    """Lazily yield all integers in the puzzle input lines."""
+    if isinstance(puzzle_input, Lines):
+        return puzzle_input.integers()
+
+    return (
+        int(match[0])
+        for line in puzzle_input
+        for match in INTEGER.finditer(line.encode("ascii"))
+    )
+
+
+def load(day, path=None):
+    """Load the input of a day, once per version of its file."""
+    path = path or f"data/day_{day}.txt"
+    stat = os.stat(path)
+
+    return load_file(day, path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=MAX_LOADED)
+def load_file(day, path, mtime, size):
+    """Memory-map an input file as a string or lines depending on day."""
+    del mtime
+
+    if size == 0:
+        buffer = b""
+    else:
+        with open(path, "rb") as input_file:
+            buffer = mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if day in TEXT_DAYS:
+        return bytes(buffer).decode("ascii").rstrip()
+
+    return Lines(buffer)
@@ -0,0 +1,231 @@
+"""Runner of all days with timing harness"""
+
+__author__ = "Martino M. L. Pulici <martinomarelakota@yahoo.it>"
+__date__ = "2025"
+__license__ = "MIT"
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import signal
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+
+import answer_cache
+import inputs
+
+DAYS = tuple(range(1, 26))
+STARS = (1, 2)
+
+
+@dataclass
+class Result:
+    """Answer and measurements of a star."""
+
+    day: int
+    star: int
+    answer: str
+    wall_time: float
+    cpu_time: float
+    peak_memory: int
+    cached: bool = False
+
+
+def main():
+    """Run the selected days and report their measurements."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("days", nargs="*", type=int, default=DAYS)
+    parser.add_argument("--json", help="write results as JSON to this path")
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="skip peak memory tracing, which slows down execution",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of worker processes, 0 for one per CPU",
+    )
+    parser.add_argument(
+        "--timeout", type=float, help="give up on a star after these seconds"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="recompute answers even if they are cached",
+    )
+    args = parser.parse_args()
+
+    results = run_days(
+        args.days,
+        not args.no_memory,
+        args.jobs,
+        args.timeout,
+        not args.no_cache,
+    )
+
+    print(format_table(results))
+
+    if args.json:
+        with open(args.json, "w", encoding="ascii") as output_file:
+            json.dump([asdict(result) for result in results], output_file)
+
+
+def format_answer(answer, width=20):
+    """Format an answer to fit in a table cell."""
+    answer = answer.strip().splitlines()[0] if answer.strip() else ""
+
+    if len(answer) > width:
+        return answer[: width - 3] + "..."
+
+    return answer
+
+
+def format_table(results):
+    """Format results as a table."""
+    lines = [
+        f"{'day':>3} {'star':>4} {'answer':<20} "
+        f"{'wall (s)':>10} {'cpu (s)':>10} {'peak (KiB)':>11} {'cache':>5}"
+    ]
+
+    for result in results:
+        lines.append(
+            f"{result.day:>3} {result.star:>4} "
+            f"{format_answer(result.answer):<20} "
+            f"{result.wall_time:>10.3f} {result.cpu_time:>10.3f} "
+            f"{result.peak_memory // 1024:>11} "
+            f"{'hit' if result.cached else '':>5}"
+        )
+
+    wall_time = sum(result.wall_time for result in results)
+    cpu_time = sum(result.cpu_time for result in results)
+    peak_memory = max((result.peak_memory for result in results), default=0)
+    lines.append(
+        f"{'':>3} {'':>4} {'total':<20} "
+        f"{wall_time:>10.3f} {cpu_time:>10.3f} {peak_memory // 1024:>11}"
+    )
+
+    return "\n".join(lines)
+
+
+def raise_timeout(signum, frame):
+    """Interrupt a star that ran out of time."""
+    del signum, frame
+
+    raise TimeoutError
+
+
+def run_days(days, trace_memory=True, jobs=1, timeout=None, use_cache=True):
+    """Run all stars of the given days, possibly in parallel."""
+    tasks = [
+        (day, star, trace_memory, timeout, use_cache)
+        for day in days
+        for star in STARS
+        if hasattr(importlib.import_module(f"day_{day}"), f"star_{star}")
+    ]
+
+    if jobs == 1:
+        return [run_task(*task) for task in tasks]
+
+    with ProcessPoolExecutor(jobs or None) as executor:
+        futures = [executor.submit(run_task, *task) for task in tasks]
+
+        return [future.result() for future in futures]
+
+
+def run_star(day, star, function, puzzle_input, trace_memory=True):
+    """Run a star measuring wall time, CPU time and peak memory."""
+    output = io.StringIO()
+    peak_memory = 0
+
+    if trace_memory:
+        tracemalloc.start()
+
+    wall_time = time.perf_counter()
+    cpu_time = time.process_time()
+
+    with contextlib.redirect_stdout(output):
+        answer = function(puzzle_input)
+
+    cpu_time = time.process_time() - cpu_time
+    wall_time = time.perf_counter() - wall_time
+
+    if trace_memory:
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    if answer is None:
+        answer = output.getvalue()
+
+    return Result(day, star, str(answer), wall_time, cpu_time, peak_memory)
+
+
+def run_task(day, star, trace_memory=True, timeout=None, use_cache=True):
+    """Run a star of a day, giving up after timeout seconds."""
+    wall_time = time.perf_counter()
+    cpu_time = time.process_time()
+    module = importlib.import_module(f"day_{day}")
+
+    if use_cache:
+        key = answer_cache.compute_key(module, star, f"data/day_{day}.txt")
+        answer = answer_cache.get(key)
+
+        if answer is not None:
+            return Result(
+                day,
+                star,
+                answer,
+                time.perf_counter() - wall_time,
+                time.process_time() - cpu_time,
+                0,
+                True,
+            )
+
+    function = getattr(module, f"star_{star}")
+    puzzle_input = inputs.load(day)
+    wall_time = time.perf_counter()
+    cpu_time = time.process_time()
+
+    try:
+        with time_limit(timeout):
+            result = run_star(day, star, function, puzzle_input, trace_memory)
+    except TimeoutError:
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        return Result(
+            day,
+            star,
+            "timeout",
+            time.perf_counter() - wall_time,
+            time.process_time() - cpu_time,
+            peak_memory,
+        )
+
+    if use_cache:
+        answer_cache.put(key, day, star, result.answer)
+
+    return result
+
+
+@contextlib.contextmanager
+def time_limit(timeout=None):
+    """Raise TimeoutError in the block once timeout seconds have passed."""
+    if timeout:
+        signal.signal(signal.SIGALRM, raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    try:
+        yield
+    finally:
+        if timeout:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+if __name__ == "__main__":
+    main()